@@ -12,7 +12,14 @@ import os
 import subprocess
 import tempfile
 import re
+import functools
+from bisect import bisect_left, bisect_right
+from math import sin, cos, radians
 from pathlib import Path
+from dataclasses import dataclass
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from array import array
 from typing import Dict, List, Tuple, Any
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -23,208 +30,277 @@ from PySide6.QtWidgets import (
     QScrollArea, QFrame, QGraphicsDropShadowEffect, QSplashScreen, QSlider,
     QSizePolicy, QPlainTextEdit
 )
-from PySide6.QtCore import Qt, QTimer, QPointF, QRectF, Signal, QThread, QPropertyAnimation, QEasingCurve, QSize, QRect, QTime
+from PySide6.QtCore import Qt, QTimer, QPointF, QRectF, Signal, QThread, QPropertyAnimation, QEasingCurve, QSize, QRect, QTime, QLine
 from PySide6.QtGui import (
     QPainter, QColor, QPen, QFont, QAction, QPalette,
     QBrush, QPainterPath, QLinearGradient, QPixmap, QIcon, QRadialGradient,
-    QSyntaxHighlighter, QTextCharFormat, QTextFormat
+    QSyntaxHighlighter, QTextCharFormat, QTextFormat, QStaticText, QTextOption, QFontMetrics,
+    QPolygonF
 )
 
 
+try:
+    # PyInstaller creates a temp folder and stores path in _MEIPASS
+    _BASE_PATH = sys._MEIPASS
+except Exception:
+    _BASE_PATH = os.path.abspath(".")
+
+
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """
     Get absolute path to resource, works for dev and for PyInstaller
     This is critical for the logo to work in the built executable
     """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
+    return os.path.join(_BASE_PATH, relative_path)
+
+
+def _trie_pattern(words):
+    """Build a prefix-factored regex alternation so the matcher walks a trie"""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
     
-    return os.path.join(base_path, relative_path)
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+    
+    return build(trie)
+
+
+# Syntax highlighter color schemes
+HIGHLIGHTER_THEMES = {
+    'Dark Blue': {
+        'keyword': '#569cd6',      # Blue
+        'datatype': '#4ec9b0',     # Teal
+        'number': '#b5cea8',       # Light green
+        'string': '#ce9178',       # Orange
+        'comment': '#6a9955',      # Green
+        'preprocessor': '#c586c0', # Purple
+        'system': '#dcdcaa'        # Yellow
+    },
+    'Monokai': {
+        'keyword': '#f92672',      # Pink
+        'datatype': '#66d9ef',     # Cyan
+        'number': '#ae81ff',       # Purple
+        'string': '#e6db74',       # Yellow
+        'comment': '#75715e',      # Gray
+        'preprocessor': '#a6e22e', # Green
+        'system': '#fd971f'        # Orange
+    },
+    'Solarized Dark': {
+        'keyword': '#268bd2',      # Blue
+        'datatype': '#2aa198',     # Cyan
+        'number': '#d33682',       # Magenta
+        'string': '#859900',       # Green
+        'comment': '#586e75',      # Gray
+        'preprocessor': '#cb4b16', # Orange
+        'system': '#b58900'        # Yellow
+    },
+    'Dracula': {
+        'keyword': '#ff79c6',      # Pink
+        'datatype': '#8be9fd',     # Cyan
+        'number': '#bd93f9',       # Purple
+        'string': '#f1fa8c',       # Yellow
+        'comment': '#6272a4',      # Gray
+        'preprocessor': '#50fa7b', # Green
+        'system': '#ffb86c'        # Orange
+    },
+    'Nord': {
+        'keyword': '#81a1c1',      # Blue
+        'datatype': '#88c0d0',     # Cyan
+        'number': '#b48ead',       # Purple
+        'string': '#a3be8c',       # Green
+        'comment': '#616e88',      # Gray
+        'preprocessor': '#d08770', # Orange
+        'system': '#ebcb8b'        # Yellow
+    },
+}
 
 
 class VerilogSyntaxHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for Verilog/SystemVerilog code"""
     
+    # QColor and per-theme format caches shared by all instances
+    _qcolor_cache = {}
+    _formats_cache = {}
+    
+    # Rules that can only match when their needle occurs in the line
+    _RULE_NEEDLES = (('comment', '//'), ('string', '"'), ('preprocessor', '`'), ('system', '$'))
+    
+    # Multi-line comment delimiters
+    _COMMENT_TOKEN = re.compile(r'/\*|\*/')
+    
+    # Blocks re-highlighted per event loop turn after a theme change
+    REHIGHLIGHT_CHUNK = 200
+    
+    # Emitted as (blocks done, total blocks) during chunked re-highlighting
+    rehighlight_progress = Signal(int, int)
+    
     def __init__(self, parent=None, theme_name="Dark Blue"):
         super().__init__(parent)
         self.theme_name = theme_name
+        self._rehighlight_next = None
         self.setup_highlighting_rules()
     
-    def setup_highlighting_rules(self):
-        """Setup syntax highlighting rules with theme colors"""
-        self.highlighting_rules = []
-        
-        # Get theme colors
-        colors = self.get_theme_colors(self.theme_name)
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_master_pattern(cls, enabled=None):
+        """Compile single-line rules into one regex with a named group per role
         
-        # Keywords format
-        keyword_format = QTextCharFormat()
-        keyword_format.setForeground(QColor(colors['keyword']))
-        keyword_format.setFontWeight(QFont.Bold)
-        
-        # Verilog/SystemVerilog keywords
+        enabled limits the needle-gated rules to those roles (None keeps all).
+        """
+        # Verilog/SystemVerilog keywords (data types are matched by the datatype rule)
         keywords = [
-            'module', 'endmodule', 'input', 'output', 'inout', 'wire', 'reg',
+            'module', 'endmodule', 'input', 'output', 'inout',
             'always', 'initial', 'begin', 'end', 'if', 'else', 'case', 'endcase',
             'for', 'while', 'assign', 'parameter', 'localparam', 'function',
             'endfunction', 'task', 'endtask', 'generate', 'endgenerate',
             'posedge', 'negedge', 'or', 'and', 'not', 'xor', 'default',
             # SystemVerilog keywords
-            'logic', 'bit', 'byte', 'int', 'integer', 'time', 'real',
             'always_ff', 'always_comb', 'always_latch', 'unique', 'priority',
             'interface', 'endinterface', 'class', 'endclass', 'package',
             'endpackage', 'import', 'export', 'typedef', 'enum', 'struct',
             'union', 'virtual', 'extends', 'implements', 'pure', 'extern',
             'signed', 'unsigned', 'void', 'return', 'break', 'continue'
         ]
-        
-        for keyword in keywords:
-            pattern = r'\b' + keyword + r'\b'
-            self.highlighting_rules.append((re.compile(pattern), keyword_format))
-        
-        # Data types format
-        datatype_format = QTextCharFormat()
-        datatype_format.setForeground(QColor(colors['datatype']))
-        datatype_format.setFontWeight(QFont.Bold)
-        
         datatypes = ['wire', 'reg', 'logic', 'bit', 'byte', 'int', 'integer', 'real', 'time']
-        for datatype in datatypes:
-            pattern = r'\b' + datatype + r'\b'
-            self.highlighting_rules.append((re.compile(pattern), datatype_format))
-        
-        # Numbers format
-        number_format = QTextCharFormat()
-        number_format.setForeground(QColor(colors['number']))
-        patterns = [
+        numbers = [
             r'\b[0-9]+\'[bB][01xXzZ_]+\b',  # Binary
             r'\b[0-9]+\'[hH][0-9a-fA-FxXzZ_]+\b',  # Hex
             r'\b[0-9]+\'[dD][0-9_]+\b',  # Decimal
             r'\b[0-9]+\b'  # Plain numbers
         ]
-        for pattern in patterns:
-            self.highlighting_rules.append((re.compile(pattern), number_format))
-        
-        # String format
-        string_format = QTextCharFormat()
-        string_format.setForeground(QColor(colors['string']))
-        self.highlighting_rules.append((re.compile(r'"[^"\\]*(\\.[^"\\]*)*"'), string_format))
-        
-        # Comment format - single line
-        comment_format = QTextCharFormat()
-        comment_format.setForeground(QColor(colors['comment']))
-        comment_format.setFontItalic(True)
-        self.highlighting_rules.append((re.compile(r'//[^\n]*'), comment_format))
-        
-        # Preprocessor directives
-        preprocessor_format = QTextCharFormat()
-        preprocessor_format.setForeground(QColor(colors['preprocessor']))
-        preprocessor_format.setFontWeight(QFont.Bold)
-        self.highlighting_rules.append((re.compile(r'`\w+'), preprocessor_format))
-        
-        # System tasks
-        system_format = QTextCharFormat()
-        system_format.setForeground(QColor(colors['system']))
-        self.highlighting_rules.append((re.compile(r'\$\w+'), system_format))
-        
-        # Multi-line comment format
-        self.comment_start_expression = re.compile(r'/\*')
-        self.comment_end_expression = re.compile(r'\*/')
-        self.multiline_comment_format = QTextCharFormat()
-        self.multiline_comment_format.setForeground(QColor(colors['comment']))
-        self.multiline_comment_format.setFontItalic(True)
+        
+        def alternation(words):
+            return r'\b' + _trie_pattern(words) + r'\b'
+        
+        rules = [
+            ('comment', r'//[^\n]*'),
+            ('string', r'"[^"\\]*(?:\\.[^"\\]*)*"'),
+            ('datatype', alternation(datatypes)),
+            ('keyword', alternation(keywords)),
+            ('number', '|'.join(numbers)),
+            ('preprocessor', r'`\w+'),
+            ('system', r'\$\w+'),
+        ]
+        gated = dict(cls._RULE_NEEDLES)
+        return re.compile('|'.join(
+            f'(?P<{role}>{pattern})' for role, pattern in rules
+            if enabled is None or role not in gated or role in enabled
+        ))
+    
+    def _build_formats(self, colors):
+        """Build a QTextCharFormat per highlighting role from theme colors"""
+        formats = {}
+        for role, color in colors.items():
+            qcolor = self._qcolor_cache.get(color)
+            if qcolor is None:
+                qcolor = self._qcolor_cache[color] = QColor(color)
+            fmt = QTextCharFormat()
+            fmt.setForeground(qcolor)
+            if role in ('keyword', 'datatype', 'preprocessor'):
+                fmt.setFontWeight(QFont.Bold)
+            elif role == 'comment':
+                fmt.setFontItalic(True)
+            formats[role] = fmt
+        return formats
+    
+    def _get_formats(self, theme_name):
+        """Get the cached role -> format map for a theme"""
+        formats = self._formats_cache.get(theme_name)
+        if formats is None:
+            formats = self._formats_cache[theme_name] = self._build_formats(self.get_theme_colors(theme_name))
+        return formats
+    
+    def setup_highlighting_rules(self):
+        """Setup syntax highlighting rules with theme colors"""
+        self.formats = self._get_formats(self.theme_name)
+        self.multiline_comment_format = self.formats['comment']
     
     def get_theme_colors(self, theme_name):
         """Get color scheme for the theme"""
-        themes = {
-            'Dark Blue': {
-                'keyword': '#569cd6',      # Blue
-                'datatype': '#4ec9b0',     # Teal
-                'number': '#b5cea8',       # Light green
-                'string': '#ce9178',       # Orange
-                'comment': '#6a9955',      # Green
-                'preprocessor': '#c586c0', # Purple
-                'system': '#dcdcaa'        # Yellow
-            },
-            'Monokai': {
-                'keyword': '#f92672',      # Pink
-                'datatype': '#66d9ef',     # Cyan
-                'number': '#ae81ff',       # Purple
-                'string': '#e6db74',       # Yellow
-                'comment': '#75715e',      # Gray
-                'preprocessor': '#a6e22e', # Green
-                'system': '#fd971f'        # Orange
-            },
-            'Solarized Dark': {
-                'keyword': '#268bd2',      # Blue
-                'datatype': '#2aa198',     # Cyan
-                'number': '#d33682',       # Magenta
-                'string': '#859900',       # Green
-                'comment': '#586e75',      # Gray
-                'preprocessor': '#cb4b16', # Orange
-                'system': '#b58900'        # Yellow
-            },
-            'Dracula': {
-                'keyword': '#ff79c6',      # Pink
-                'datatype': '#8be9fd',     # Cyan
-                'number': '#bd93f9',       # Purple
-                'string': '#f1fa8c',       # Yellow
-                'comment': '#6272a4',      # Gray
-                'preprocessor': '#50fa7b', # Green
-                'system': '#ffb86c'        # Orange
-            },
-            'Nord': {
-                'keyword': '#81a1c1',      # Blue
-                'datatype': '#88c0d0',     # Cyan
-                'number': '#b48ead',       # Purple
-                'string': '#a3be8c',       # Green
-                'comment': '#616e88',      # Gray
-                'preprocessor': '#d08770', # Orange
-                'system': '#ebcb8b'        # Yellow
-            },
-        }
-        
         # Return theme or default to Dark Blue
-        return themes.get(theme_name, themes['Dark Blue'])
+        return HIGHLIGHTER_THEMES.get(theme_name, HIGHLIGHTER_THEMES['Dark Blue'])
     
     def highlightBlock(self, text):
         """Apply syntax highlighting to a block of text"""
-        # Apply single-line rules
-        for pattern, format in self.highlighting_rules:
-            for match in pattern.finditer(text):
-                start = match.start()
-                length = match.end() - match.start()
-                self.setFormat(start, length, format)
+        # Apply single-line rules in one scan, leaving out rules whose needle is absent
+        enabled = tuple(role for role, needle in self._RULE_NEEDLES if needle in text)
+        formats = self.formats
+        set_format = self.setFormat
+        for match in self._get_master_pattern(enabled).finditer(text):
+            start, end = match.span()
+            set_format(start, end - start, formats[match.lastgroup])
         
         # Handle multi-line comments
         self.setCurrentBlockState(0)
-        start_index = 0
+        in_comment = self.previousBlockState() == 1
         
-        if self.previousBlockState() != 1:
-            start_match = self.comment_start_expression.search(text)
-            start_index = start_match.start() if start_match else -1
+        # Fast path: not inside a comment and no comment opens on this line
+        if not in_comment and '/*' not in text:
+            return
         
-        while start_index >= 0:
-            end_match = self.comment_end_expression.search(text, start_index)
-            
-            if end_match:
-                length = end_match.end() - start_index
-                self.setFormat(start_index, length, self.multiline_comment_format)
-                start_match = self.comment_start_expression.search(text, end_match.end())
-                start_index = start_match.start() if start_match else -1
-            else:
-                self.setCurrentBlockState(1)
-                length = len(text) - start_index
-                self.setFormat(start_index, length, self.multiline_comment_format)
-                break
+        # Walk '/*' and '*/' tokens in one pass, tracking whether we are inside a comment
+        start_index = 0
+        for token in self._COMMENT_TOKEN.finditer(text):
+            if in_comment:
+                if token.group() == '*/':
+                    self.setFormat(start_index, token.end() - start_index, self.multiline_comment_format)
+                    in_comment = False
+            elif token.group() == '/*':
+                start_index = token.start()
+                in_comment = True
+        
+        if in_comment:
+            self.setCurrentBlockState(1)
+            self.setFormat(start_index, len(text) - start_index, self.multiline_comment_format)
     
     def update_theme(self, theme_name):
         """Update highlighting theme"""
         self.theme_name = theme_name
-        self.setup_highlighting_rules()
-        self.rehighlight()
+        self.formats = self._get_formats(theme_name)
+        self.multiline_comment_format = self.formats['comment']
+        
+        # Small documents are re-highlighted at once, large ones in chunks
+        document = self.document()
+        if document is None or document.blockCount() <= self.REHIGHLIGHT_CHUNK:
+            self.rehighlight()
+            return
+        
+        chunk_pending = self._rehighlight_next is not None
+        self._rehighlight_next = 0
+        if not chunk_pending:
+            QTimer.singleShot(0, self._rehighlight_chunk)
+    
+    def _rehighlight_chunk(self):
+        """Re-highlight the next chunk of blocks, then yield to the event loop"""
+        document = self.document()
+        if document is None or self._rehighlight_next is None:
+            self._rehighlight_next = None
+            return
+        
+        total = document.blockCount()
+        block = document.findBlockByNumber(self._rehighlight_next)
+        for _ in range(self.REHIGHLIGHT_CHUNK):
+            if not block.isValid():
+                break
+            self.rehighlightBlock(block)
+            block = block.next()
+        
+        if block.isValid():
+            self._rehighlight_next = block.blockNumber()
+            self.rehighlight_progress.emit(self._rehighlight_next, total)
+            QTimer.singleShot(0, self._rehighlight_chunk)
+        else:
+            self._rehighlight_next = None
+            self.rehighlight_progress.emit(total, total)
 
 
 class LineNumberArea(QWidget):
@@ -247,6 +323,10 @@ class CodeEditor(QPlainTextEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        # Last (block count, font key) -> line number area width
+        self._ln_width_key = None
+        self._ln_width = 0
+        
         # Create line number area
         self.line_number_area = LineNumberArea(self)
         
@@ -262,19 +342,29 @@ class CodeEditor(QPlainTextEdit):
         # Set font
         self.setFont(QFont("Consolas", 10))
         
+        # Line number fonts and colors, reused on every paint
+        self._ln_font_normal = QFont("Consolas", 10)
+        self._ln_font_bold = QFont("Consolas", 10, QFont.Bold)
+        self._ln_pen_current = QColor(0, 255, 100)  # Bright green for current line
+        self._ln_pen_other = QColor(100, 116, 139)  # Gray for other lines
+        self._ln_bg = QColor(20, 31, 49)
+        
+        # Pre-laid-out line numbers, rebuilt when the gutter width changes
+        self._static_numbers = {}
+        self._static_numbers_width = None
+        
         # Tab settings - use 4 spaces
         self.setTabStopDistance(40)  # 4 spaces * 10 pixels per character
     
     def line_number_area_width(self):
         """Calculate the width needed for line numbers"""
-        digits = 1
-        max_num = max(1, self.blockCount())
-        while max_num >= 10:
-            max_num //= 10
-            digits += 1
-        
-        space = 10 + self.fontMetrics().horizontalAdvance('9') * digits
-        return space
+        block_count = self.blockCount()
+        key = (block_count, self.font().key())
+        if key != self._ln_width_key:
+            digits = len(str(max(1, block_count)))
+            self._ln_width = 10 + self.fontMetrics().horizontalAdvance('9') * digits
+            self._ln_width_key = key
+        return self._ln_width
     
     def update_line_number_area_width(self, _):
         """Update the width of line number area"""
@@ -320,7 +410,7 @@ class CodeEditor(QPlainTextEdit):
         painter = QPainter(self.line_number_area)
         
         # Background color for line number area
-        painter.fillRect(event.rect(), QColor(20, 31, 49))
+        painter.fillRect(event.rect(), self._ln_bg)
         
         # Get the first visible block
         block = self.firstVisibleBlock()
@@ -328,25 +418,39 @@ class CodeEditor(QPlainTextEdit):
         top = int(self.blockBoundingGeometry(block).translated(self.contentOffset()).top())
         bottom = top + int(self.blockBoundingRect(block).height())
         
-        # Set up fonts and colors
-        painter.setFont(self.font())
+        # Loop invariants
+        fh = self.fontMetrics().height()
+        width = self.line_number_area.width() - 5
+        current_block = self.textCursor().blockNumber()
+        rect_top = event.rect().top()
+        rect_bottom = event.rect().bottom()
+        
+        if width != self._static_numbers_width:
+            self._static_numbers.clear()
+            self._static_numbers_width = width
+        static_numbers = self._static_numbers
+        
+        painter.setPen(self._ln_pen_other)
+        painter.setFont(self._ln_font_normal)
         
         # Paint line numbers
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                number = str(block_number + 1)
-                
+        while block.isValid() and top <= rect_bottom:
+            if block.isVisible() and bottom >= rect_top:
                 # Highlight current line number
-                if self.textCursor().blockNumber() == block_number:
-                    painter.setPen(QColor(0, 255, 100))  # Bright green for current line
-                    painter.setFont(QFont("Consolas", 10, QFont.Bold))
+                if block_number == current_block:
+                    painter.setPen(self._ln_pen_current)
+                    painter.setFont(self._ln_font_bold)
+                    painter.drawText(0, top, width, fh, Qt.AlignRight, str(block_number + 1))
+                    painter.setPen(self._ln_pen_other)
+                    painter.setFont(self._ln_font_normal)
                 else:
-                    painter.setPen(QColor(100, 116, 139))  # Gray for other lines
-                    painter.setFont(QFont("Consolas", 10))
-                
-                painter.drawText(0, top, self.line_number_area.width() - 5, 
-                               self.fontMetrics().height(),
-                               Qt.AlignRight, number)
+                    static = static_numbers.get(block_number)
+                    if static is None:
+                        static = QStaticText(str(block_number + 1))
+                        static.setTextWidth(width)
+                        static.setTextOption(QTextOption(Qt.AlignRight))
+                        static_numbers[block_number] = static
+                    painter.drawStaticText(0, top, static)
             
             block = block.next()
             top = bottom
@@ -354,6 +458,118 @@ class CodeEditor(QPlainTextEdit):
             block_number += 1
 
 
+@dataclass(frozen=True, slots=True)
+class Theme:
+    """RGB colors for each UI role of an application theme"""
+    primary: tuple
+    secondary: tuple
+    accent: tuple
+    text: tuple
+    highlight: tuple
+
+
+# Application themes: name -> (primary, secondary, accent, text, highlight) RGB tuples
+_RAW_THEMES = {
+    # Deep Black Green (NEW DEFAULT)
+    "Deep Black Green": ((0, 0, 0), (10, 10, 10), (0, 255, 100), (220, 220, 220), (100, 255, 150)),
+    # Dark Themes (1-15)
+    "Dark Blue Ocean": ((15, 23, 42), (30, 41, 59), (59, 130, 246), (226, 232, 240), (147, 197, 253)),
+    "Midnight Purple": ((17, 17, 38), (30, 30, 60), (147, 51, 234), (229, 229, 246), (192, 132, 252)),
+    "Dark Emerald": ((6, 20, 15), (20, 40, 30), (16, 185, 129), (209, 250, 229), (110, 231, 183)),
+    "Carbon Black": ((10, 10, 10), (25, 25, 25), (220, 220, 220), (240, 240, 240), (180, 180, 180)),
+    "Deep Navy": ((8, 15, 30), (15, 30, 50), (70, 130, 200), (220, 230, 245), (130, 170, 220)),
+    "Volcanic Ash": ((25, 20, 20), (40, 35, 35), (255, 100, 70), (250, 240, 235), (255, 150, 120)),
+    "Forest Night": ((10, 20, 15), (20, 35, 25), (80, 200, 120), (230, 250, 235), (130, 230, 165)),
+    "Royal Purple": ((20, 10, 30), (35, 20, 50), (160, 80, 240), (240, 230, 250), (200, 150, 255)),
+    "Obsidian": ((5, 8, 12), (15, 20, 28), (100, 150, 200), (230, 235, 245), (150, 180, 220)),
+    "Crimson Shadow": ((25, 10, 15), (40, 20, 25), (220, 50, 80), (250, 235, 240), (255, 100, 130)),
+    "Deep Teal": ((10, 25, 28), (20, 40, 45), (80, 200, 200), (230, 250, 250), (130, 230, 230)),
+    "Slate Gray": ((30, 35, 40), (45, 52, 60), (150, 170, 190), (230, 235, 240), (180, 200, 220)),
+    "Chocolate Brown": ((25, 15, 10), (40, 25, 15), (200, 140, 100), (250, 240, 230), (230, 180, 140)),
+    "Electric Indigo": ((15, 10, 35), (25, 18, 55), (130, 90, 255), (240, 235, 255), (180, 150, 255)),
+    "Charcoal": ((20, 22, 25), (35, 38, 42), (100, 110, 125), (220, 225, 230), (150, 160, 175)),
+    
+    # Blue Themes (16-25)
+    "Azure Sky": ((40, 50, 80), (55, 65, 100), (120, 180, 255), (240, 245, 255), (160, 200, 255)),
+    "Cyan Dream": ((30, 50, 60), (45, 70, 85), (100, 220, 255), (235, 250, 255), (150, 235, 255)),
+    "Sapphire": ((20, 35, 70), (35, 55, 95), (80, 140, 240), (230, 240, 255), (130, 180, 250)),
+    "Ice Blue": ((45, 55, 70), (60, 75, 95), (150, 220, 255), (240, 248, 255), (180, 230, 255)),
+    "Ocean Breeze": ((30, 45, 55), (45, 65, 80), (90, 200, 240), (235, 248, 252), (140, 220, 250)),
+    "Steel Blue": ((35, 45, 60), (50, 65, 85), (110, 160, 220), (230, 240, 250), (150, 190, 235)),
+    "Cobalt": ((25, 40, 75), (40, 60, 100), (70, 130, 240), (225, 238, 255), (120, 170, 250)),
+    "Powder Blue": ((50, 60, 75), (70, 85, 100), (130, 190, 235), (240, 248, 255), (170, 210, 245)),
+    "Navy Mist": ((28, 40, 58), (42, 58, 80), (90, 150, 210), (228, 238, 250), (135, 180, 230)),
+    "Arctic Blue": ((42, 52, 65), (58, 72, 88), (140, 210, 245), (238, 246, 252), (175, 225, 252)),
+    
+    # Green Themes (26-32)
+    "Emerald Forest": ((20, 40, 30), (35, 60, 48), (50, 200, 120), (230, 250, 240), (100, 230, 170)),
+    "Mint Fresh": ((35, 55, 45), (50, 75, 65), (120, 240, 180), (240, 255, 248), (160, 250, 210)),
+    "Jade": ((25, 45, 40), (40, 65, 58), (80, 220, 160), (235, 252, 245), (130, 240, 190)),
+    "Lime Zest": ((40, 50, 30), (58, 72, 45), (160, 240, 80), (245, 255, 235), (190, 250, 130)),
+    "Pine": ((25, 35, 25), (40, 55, 40), (90, 180, 90), (235, 245, 235), (140, 210, 140)),
+    "Seafoam": ((35, 50, 48), (52, 72, 70), (110, 230, 210), (240, 252, 250), (155, 245, 230)),
+    "Olive": ((35, 40, 28), (52, 60, 42), (150, 180, 90), (242, 248, 235), (185, 210, 135)),
+    
+    # Purple/Pink Themes (33-40)
+    "Lavender": ((45, 40, 60), (65, 58, 85), (180, 150, 240), (248, 245, 255), (210, 190, 250)),
+    "Magenta Glow": ((40, 25, 45), (60, 40, 68), (240, 100, 220), (255, 240, 252), (255, 150, 240)),
+    "Amethyst": ((35, 25, 50), (52, 40, 75), (160, 90, 230), (245, 238, 255), (195, 140, 250)),
+    "Rose": ((50, 35, 40), (72, 52, 60), (255, 140, 180), (255, 245, 248), (255, 180, 210)),
+    "Plum": ((35, 25, 40), (52, 40, 60), (200, 120, 200), (250, 240, 250), (230, 170, 230)),
+    "Orchid": ((45, 35, 55), (65, 52, 78), (220, 140, 255), (252, 245, 255), (240, 180, 255)),
+    "Fuchsia": ((40, 20, 40), (60, 35, 60), (255, 80, 220), (255, 235, 250), (255, 130, 240)),
+    "Violet Mist": ((38, 30, 52), (55, 45, 75), (170, 120, 240), (245, 240, 255), (200, 165, 250)),
+    
+    # Warm Themes (41-48)
+    "Sunset Orange": ((45, 30, 20), (68, 48, 35), (255, 150, 70), (255, 245, 238), (255, 180, 110)),
+    "Coral Reef": ((48, 35, 35), (70, 52, 52), (255, 130, 120), (255, 248, 246), (255, 170, 160)),
+    "Amber": ((42, 35, 20), (62, 52, 32), (255, 190, 50), (255, 250, 235), (255, 210, 100)),
+    "Peach": ((52, 42, 38), (75, 62, 55), (255, 180, 150), (255, 250, 245), (255, 200, 175)),
+    "Copper": ((38, 28, 22), (58, 45, 35), (220, 130, 80), (250, 242, 235), (240, 165, 120)),
+    "Terracotta": ((42, 30, 25), (62, 48, 40), (210, 110, 80), (252, 245, 240), (235, 145, 115)),
+    "Cinnamon": ((38, 30, 25), (58, 48, 40), (200, 120, 80), (250, 245, 238), (225, 155, 115)),
+    "Bronze": ((35, 30, 20), (52, 48, 32), (205, 150, 90), (248, 245, 235), (225, 175, 125)),
+    
+    # Special Themes (49-50)
+    "Hacker Matrix": ((0, 8, 0), (0, 20, 0), (0, 255, 65), (180, 255, 180), (100, 255, 150)),
+    "Neon Cyberpunk": ((10, 5, 25), (20, 12, 40), (255, 0, 255), (0, 255, 255), (255, 100, 255))
+}
+
+# Pre-formatted "rgba(r, g, b, " prefixes keyed by RGB tuple
+_RGB_PREFIX = {}
+
+
+def _css_rgba(rgb, alpha):
+    """Format an RGB tuple and alpha as a CSS rgba() color"""
+    prefix = _RGB_PREFIX.get(rgb)
+    if prefix is None:
+        prefix = _RGB_PREFIX[rgb] = f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, "
+    return f"{prefix}{alpha:.3f})"
+
+
+class _LazyThemes(Mapping):
+    """Read-only theme table that builds Theme objects on first access"""
+    
+    def __init__(self, raw_themes):
+        self._raw = raw_themes
+        self._built = {}
+    
+    def __getitem__(self, name):
+        theme = self._built.get(name)
+        if theme is None:
+            theme = self._built[name] = Theme(*self._raw[name])
+        return theme
+    
+    def __iter__(self):
+        return iter(self._raw)
+    
+    def __len__(self):
+        return len(self._raw)
+
+
+ALL_THEMES = _LazyThemes(_RAW_THEMES)
+
+
 class ThemeManager:
     """Manage 50 different transparent themes with opacity control"""
     
@@ -364,409 +580,46 @@ class ThemeManager:
     
     def get_all_themes(self):
         """Return all 50 beautiful themes"""
-        return {
-            # Deep Black Green (NEW DEFAULT)
-            "Deep Black Green": {
-                'primary': (0, 0, 0),
-                'secondary': (10, 10, 10),
-                'accent': (0, 255, 100),
-                'text': (220, 220, 220),
-                'highlight': (100, 255, 150)
-            },
-            # Dark Themes (1-15)
-            "Dark Blue Ocean": {
-                'primary': (15, 23, 42),
-                'secondary': (30, 41, 59),
-                'accent': (59, 130, 246),
-                'text': (226, 232, 240),
-                'highlight': (147, 197, 253)
-            },
-            "Midnight Purple": {
-                'primary': (17, 17, 38),
-                'secondary': (30, 30, 60),
-                'accent': (147, 51, 234),
-                'text': (229, 229, 246),
-                'highlight': (192, 132, 252)
-            },
-            "Dark Emerald": {
-                'primary': (6, 20, 15),
-                'secondary': (20, 40, 30),
-                'accent': (16, 185, 129),
-                'text': (209, 250, 229),
-                'highlight': (110, 231, 183)
-            },
-            "Carbon Black": {
-                'primary': (10, 10, 10),
-                'secondary': (25, 25, 25),
-                'accent': (220, 220, 220),
-                'text': (240, 240, 240),
-                'highlight': (180, 180, 180)
-            },
-            "Deep Navy": {
-                'primary': (8, 15, 30),
-                'secondary': (15, 30, 50),
-                'accent': (70, 130, 200),
-                'text': (220, 230, 245),
-                'highlight': (130, 170, 220)
-            },
-            "Volcanic Ash": {
-                'primary': (25, 20, 20),
-                'secondary': (40, 35, 35),
-                'accent': (255, 100, 70),
-                'text': (250, 240, 235),
-                'highlight': (255, 150, 120)
-            },
-            "Forest Night": {
-                'primary': (10, 20, 15),
-                'secondary': (20, 35, 25),
-                'accent': (80, 200, 120),
-                'text': (230, 250, 235),
-                'highlight': (130, 230, 165)
-            },
-            "Royal Purple": {
-                'primary': (20, 10, 30),
-                'secondary': (35, 20, 50),
-                'accent': (160, 80, 240),
-                'text': (240, 230, 250),
-                'highlight': (200, 150, 255)
-            },
-            "Obsidian": {
-                'primary': (5, 8, 12),
-                'secondary': (15, 20, 28),
-                'accent': (100, 150, 200),
-                'text': (230, 235, 245),
-                'highlight': (150, 180, 220)
-            },
-            "Crimson Shadow": {
-                'primary': (25, 10, 15),
-                'secondary': (40, 20, 25),
-                'accent': (220, 50, 80),
-                'text': (250, 235, 240),
-                'highlight': (255, 100, 130)
-            },
-            "Deep Teal": {
-                'primary': (10, 25, 28),
-                'secondary': (20, 40, 45),
-                'accent': (80, 200, 200),
-                'text': (230, 250, 250),
-                'highlight': (130, 230, 230)
-            },
-            "Slate Gray": {
-                'primary': (30, 35, 40),
-                'secondary': (45, 52, 60),
-                'accent': (150, 170, 190),
-                'text': (230, 235, 240),
-                'highlight': (180, 200, 220)
-            },
-            "Chocolate Brown": {
-                'primary': (25, 15, 10),
-                'secondary': (40, 25, 15),
-                'accent': (200, 140, 100),
-                'text': (250, 240, 230),
-                'highlight': (230, 180, 140)
-            },
-            "Electric Indigo": {
-                'primary': (15, 10, 35),
-                'secondary': (25, 18, 55),
-                'accent': (130, 90, 255),
-                'text': (240, 235, 255),
-                'highlight': (180, 150, 255)
-            },
-            "Charcoal": {
-                'primary': (20, 22, 25),
-                'secondary': (35, 38, 42),
-                'accent': (100, 110, 125),
-                'text': (220, 225, 230),
-                'highlight': (150, 160, 175)
-            },
-            
-            # Blue Themes (16-25)
-            "Azure Sky": {
-                'primary': (40, 50, 80),
-                'secondary': (55, 65, 100),
-                'accent': (120, 180, 255),
-                'text': (240, 245, 255),
-                'highlight': (160, 200, 255)
-            },
-            "Cyan Dream": {
-                'primary': (30, 50, 60),
-                'secondary': (45, 70, 85),
-                'accent': (100, 220, 255),
-                'text': (235, 250, 255),
-                'highlight': (150, 235, 255)
-            },
-            "Sapphire": {
-                'primary': (20, 35, 70),
-                'secondary': (35, 55, 95),
-                'accent': (80, 140, 240),
-                'text': (230, 240, 255),
-                'highlight': (130, 180, 250)
-            },
-            "Ice Blue": {
-                'primary': (45, 55, 70),
-                'secondary': (60, 75, 95),
-                'accent': (150, 220, 255),
-                'text': (240, 248, 255),
-                'highlight': (180, 230, 255)
-            },
-            "Ocean Breeze": {
-                'primary': (30, 45, 55),
-                'secondary': (45, 65, 80),
-                'accent': (90, 200, 240),
-                'text': (235, 248, 252),
-                'highlight': (140, 220, 250)
-            },
-            "Steel Blue": {
-                'primary': (35, 45, 60),
-                'secondary': (50, 65, 85),
-                'accent': (110, 160, 220),
-                'text': (230, 240, 250),
-                'highlight': (150, 190, 235)
-            },
-            "Cobalt": {
-                'primary': (25, 40, 75),
-                'secondary': (40, 60, 100),
-                'accent': (70, 130, 240),
-                'text': (225, 238, 255),
-                'highlight': (120, 170, 250)
-            },
-            "Powder Blue": {
-                'primary': (50, 60, 75),
-                'secondary': (70, 85, 100),
-                'accent': (130, 190, 235),
-                'text': (240, 248, 255),
-                'highlight': (170, 210, 245)
-            },
-            "Navy Mist": {
-                'primary': (28, 40, 58),
-                'secondary': (42, 58, 80),
-                'accent': (90, 150, 210),
-                'text': (228, 238, 250),
-                'highlight': (135, 180, 230)
-            },
-            "Arctic Blue": {
-                'primary': (42, 52, 65),
-                'secondary': (58, 72, 88),
-                'accent': (140, 210, 245),
-                'text': (238, 246, 252),
-                'highlight': (175, 225, 252)
-            },
-            
-            # Green Themes (26-32)
-            "Emerald Forest": {
-                'primary': (20, 40, 30),
-                'secondary': (35, 60, 48),
-                'accent': (50, 200, 120),
-                'text': (230, 250, 240),
-                'highlight': (100, 230, 170)
-            },
-            "Mint Fresh": {
-                'primary': (35, 55, 45),
-                'secondary': (50, 75, 65),
-                'accent': (120, 240, 180),
-                'text': (240, 255, 248),
-                'highlight': (160, 250, 210)
-            },
-            "Jade": {
-                'primary': (25, 45, 40),
-                'secondary': (40, 65, 58),
-                'accent': (80, 220, 160),
-                'text': (235, 252, 245),
-                'highlight': (130, 240, 190)
-            },
-            "Lime Zest": {
-                'primary': (40, 50, 30),
-                'secondary': (58, 72, 45),
-                'accent': (160, 240, 80),
-                'text': (245, 255, 235),
-                'highlight': (190, 250, 130)
-            },
-            "Pine": {
-                'primary': (25, 35, 25),
-                'secondary': (40, 55, 40),
-                'accent': (90, 180, 90),
-                'text': (235, 245, 235),
-                'highlight': (140, 210, 140)
-            },
-            "Seafoam": {
-                'primary': (35, 50, 48),
-                'secondary': (52, 72, 70),
-                'accent': (110, 230, 210),
-                'text': (240, 252, 250),
-                'highlight': (155, 245, 230)
-            },
-            "Olive": {
-                'primary': (35, 40, 28),
-                'secondary': (52, 60, 42),
-                'accent': (150, 180, 90),
-                'text': (242, 248, 235),
-                'highlight': (185, 210, 135)
-            },
-            
-            # Purple/Pink Themes (33-40)
-            "Lavender": {
-                'primary': (45, 40, 60),
-                'secondary': (65, 58, 85),
-                'accent': (180, 150, 240),
-                'text': (248, 245, 255),
-                'highlight': (210, 190, 250)
-            },
-            "Magenta Glow": {
-                'primary': (40, 25, 45),
-                'secondary': (60, 40, 68),
-                'accent': (240, 100, 220),
-                'text': (255, 240, 252),
-                'highlight': (255, 150, 240)
-            },
-            "Amethyst": {
-                'primary': (35, 25, 50),
-                'secondary': (52, 40, 75),
-                'accent': (160, 90, 230),
-                'text': (245, 238, 255),
-                'highlight': (195, 140, 250)
-            },
-            "Rose": {
-                'primary': (50, 35, 40),
-                'secondary': (72, 52, 60),
-                'accent': (255, 140, 180),
-                'text': (255, 245, 248),
-                'highlight': (255, 180, 210)
-            },
-            "Plum": {
-                'primary': (35, 25, 40),
-                'secondary': (52, 40, 60),
-                'accent': (200, 120, 200),
-                'text': (250, 240, 250),
-                'highlight': (230, 170, 230)
-            },
-            "Orchid": {
-                'primary': (45, 35, 55),
-                'secondary': (65, 52, 78),
-                'accent': (220, 140, 255),
-                'text': (252, 245, 255),
-                'highlight': (240, 180, 255)
-            },
-            "Fuchsia": {
-                'primary': (40, 20, 40),
-                'secondary': (60, 35, 60),
-                'accent': (255, 80, 220),
-                'text': (255, 235, 250),
-                'highlight': (255, 130, 240)
-            },
-            "Violet Mist": {
-                'primary': (38, 30, 52),
-                'secondary': (55, 45, 75),
-                'accent': (170, 120, 240),
-                'text': (245, 240, 255),
-                'highlight': (200, 165, 250)
-            },
-            
-            # Warm Themes (41-48)
-            "Sunset Orange": {
-                'primary': (45, 30, 20),
-                'secondary': (68, 48, 35),
-                'accent': (255, 150, 70),
-                'text': (255, 245, 238),
-                'highlight': (255, 180, 110)
-            },
-            "Coral Reef": {
-                'primary': (48, 35, 35),
-                'secondary': (70, 52, 52),
-                'accent': (255, 130, 120),
-                'text': (255, 248, 246),
-                'highlight': (255, 170, 160)
-            },
-            "Amber": {
-                'primary': (42, 35, 20),
-                'secondary': (62, 52, 32),
-                'accent': (255, 190, 50),
-                'text': (255, 250, 235),
-                'highlight': (255, 210, 100)
-            },
-            "Peach": {
-                'primary': (52, 42, 38),
-                'secondary': (75, 62, 55),
-                'accent': (255, 180, 150),
-                'text': (255, 250, 245),
-                'highlight': (255, 200, 175)
-            },
-            "Copper": {
-                'primary': (38, 28, 22),
-                'secondary': (58, 45, 35),
-                'accent': (220, 130, 80),
-                'text': (250, 242, 235),
-                'highlight': (240, 165, 120)
-            },
-            "Terracotta": {
-                'primary': (42, 30, 25),
-                'secondary': (62, 48, 40),
-                'accent': (210, 110, 80),
-                'text': (252, 245, 240),
-                'highlight': (235, 145, 115)
-            },
-            "Cinnamon": {
-                'primary': (38, 30, 25),
-                'secondary': (58, 48, 40),
-                'accent': (200, 120, 80),
-                'text': (250, 245, 238),
-                'highlight': (225, 155, 115)
-            },
-            "Bronze": {
-                'primary': (35, 30, 20),
-                'secondary': (52, 48, 32),
-                'accent': (205, 150, 90),
-                'text': (248, 245, 235),
-                'highlight': (225, 175, 125)
-            },
-            
-            # Special Themes (49-50)
-            "Hacker Matrix": {
-                'primary': (0, 8, 0),
-                'secondary': (0, 20, 0),
-                'accent': (0, 255, 65),
-                'text': (180, 255, 180),
-                'highlight': (100, 255, 150)
-            },
-            "Neon Cyberpunk": {
-                'primary': (10, 5, 25),
-                'secondary': (20, 12, 40),
-                'accent': (255, 0, 255),
-                'text': (0, 255, 255),
-                'highlight': (255, 100, 255)
-            }
-        }
+        return ALL_THEMES
     
     def get_stylesheet(self, theme_name, opacity):
         """Generate stylesheet for the theme with opacity"""
-        theme = self.themes.get(theme_name, self.themes["Dark Blue Ocean"])
+        return self._build_stylesheet(theme_name, round(opacity * 100))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _build_stylesheet(theme_name, opacity_percent):
+        """Build (and cache) the stylesheet for a theme and opacity percentage"""
+        opacity = opacity_percent / 100
+        theme = ALL_THEMES.get(theme_name, ALL_THEMES["Dark Blue Ocean"])
         
         # Convert RGB to RGBA with opacity
         def rgba(rgb, alpha=None):
             if alpha is None:
                 alpha = opacity
-            return f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, {alpha})"
+            return _css_rgba(rgb, alpha)
         
         return f"""
             QMainWindow {{
-                background-color: {rgba(theme['primary'])};
+                background-color: {rgba(theme.primary)};
             }}
             
             QWidget {{
-                background-color: {rgba(theme['primary'])};
-                color: {rgba(theme['text'], 1.0)};
+                background-color: {rgba(theme.primary)};
+                color: {rgba(theme.text, 1.0)};
             }}
             
             QTextEdit, QTreeWidget, QTableWidget, QPlainTextEdit {{
-                background-color: {rgba(theme['secondary'], opacity * 0.8)};
-                color: {rgba(theme['text'], 1.0)};
-                border: 1px solid {rgba(theme['accent'], opacity * 0.5)};
+                background-color: {rgba(theme.secondary, opacity * 0.8)};
+                color: {rgba(theme.text, 1.0)};
+                border: 1px solid {rgba(theme.accent, opacity * 0.5)};
                 border-radius: 5px;
                 padding: 5px;
             }}
             
             QPushButton {{
-                background-color: {rgba(theme['accent'], opacity * 0.8)};
-                color: {rgba(theme['text'], 1.0)};
+                background-color: {rgba(theme.accent, opacity * 0.8)};
+                color: {rgba(theme.text, 1.0)};
                 border: none;
                 border-radius: 5px;
                 padding: 8px 16px;
@@ -774,15 +627,15 @@ class ThemeManager:
             }}
             
             QPushButton:hover {{
-                background-color: {rgba(theme['highlight'], opacity * 0.9)};
+                background-color: {rgba(theme.highlight, opacity * 0.9)};
             }}
             
             QPushButton:pressed {{
-                background-color: {rgba(theme['accent'], opacity * 0.6)};
+                background-color: {rgba(theme.accent, opacity * 0.6)};
             }}
             
             QGroupBox {{
-                border: 2px solid {rgba(theme['accent'], opacity * 0.6)};
+                border: 2px solid {rgba(theme.accent, opacity * 0.6)};
                 border-radius: 8px;
                 margin-top: 10px;
                 font-weight: bold;
@@ -790,21 +643,21 @@ class ThemeManager:
             }}
             
             QGroupBox::title {{
-                color: {rgba(theme['highlight'], 1.0)};
+                color: {rgba(theme.highlight, 1.0)};
                 subcontrol-origin: margin;
                 left: 10px;
                 padding: 0 5px;
             }}
             
             QTabWidget::pane {{
-                border: 1px solid {rgba(theme['accent'], opacity * 0.5)};
-                background: {rgba(theme['primary'])};
+                border: 1px solid {rgba(theme.accent, opacity * 0.5)};
+                background: {rgba(theme.primary)};
                 border-radius: 5px;
             }}
             
             QTabBar::tab {{
-                background: {rgba(theme['secondary'], opacity * 0.7)};
-                color: {rgba(theme['text'], 0.8)};
+                background: {rgba(theme.secondary, opacity * 0.7)};
+                color: {rgba(theme.text, 0.8)};
                 padding: 10px 20px;
                 margin-right: 2px;
                 border-top-left-radius: 5px;
@@ -812,86 +665,86 @@ class ThemeManager:
             }}
             
             QTabBar::tab:selected {{
-                background: {rgba(theme['accent'], opacity * 0.9)};
-                color: {rgba(theme['text'], 1.0)};
+                background: {rgba(theme.accent, opacity * 0.9)};
+                color: {rgba(theme.text, 1.0)};
             }}
             
             QMenuBar {{
-                background-color: {rgba(theme['secondary'], opacity * 0.9)};
-                color: {rgba(theme['text'], 1.0)};
+                background-color: {rgba(theme.secondary, opacity * 0.9)};
+                color: {rgba(theme.text, 1.0)};
             }}
             
             QMenuBar::item:selected {{
-                background-color: {rgba(theme['accent'], opacity * 0.8)};
+                background-color: {rgba(theme.accent, opacity * 0.8)};
             }}
             
             QMenu {{
-                background-color: {rgba(theme['secondary'], opacity * 0.95)};
-                color: {rgba(theme['text'], 1.0)};
-                border: 1px solid {rgba(theme['accent'], opacity * 0.6)};
+                background-color: {rgba(theme.secondary, opacity * 0.95)};
+                color: {rgba(theme.text, 1.0)};
+                border: 1px solid {rgba(theme.accent, opacity * 0.6)};
             }}
             
             QMenu::item:selected {{
-                background-color: {rgba(theme['accent'], opacity * 0.8)};
+                background-color: {rgba(theme.accent, opacity * 0.8)};
             }}
             
             QStatusBar {{
-                background-color: {rgba(theme['secondary'], opacity * 0.9)};
-                color: {rgba(theme['text'], 1.0)};
+                background-color: {rgba(theme.secondary, opacity * 0.9)};
+                color: {rgba(theme.text, 1.0)};
             }}
             
             QScrollBar:vertical {{
-                background: {rgba(theme['secondary'], opacity * 0.5)};
+                background: {rgba(theme.secondary, opacity * 0.5)};
                 width: 12px;
                 border-radius: 6px;
             }}
             
             QScrollBar::handle:vertical {{
-                background: {rgba(theme['accent'], opacity * 0.7)};
+                background: {rgba(theme.accent, opacity * 0.7)};
                 border-radius: 6px;
             }}
             
             QScrollBar::handle:vertical:hover {{
-                background: {rgba(theme['highlight'], opacity * 0.8)};
+                background: {rgba(theme.highlight, opacity * 0.8)};
             }}
             
             QScrollBar:horizontal {{
-                background: {rgba(theme['secondary'], opacity * 0.5)};
+                background: {rgba(theme.secondary, opacity * 0.5)};
                 height: 12px;
                 border-radius: 6px;
             }}
             
             QScrollBar::handle:horizontal {{
-                background: {rgba(theme['accent'], opacity * 0.7)};
+                background: {rgba(theme.accent, opacity * 0.7)};
                 border-radius: 6px;
             }}
             
             QSlider::groove:horizontal {{
-                border: 1px solid {rgba(theme['accent'], opacity * 0.4)};
+                border: 1px solid {rgba(theme.accent, opacity * 0.4)};
                 height: 8px;
-                background: {rgba(theme['secondary'], opacity * 0.6)};
+                background: {rgba(theme.secondary, opacity * 0.6)};
                 border-radius: 4px;
             }}
             
             QSlider::handle:horizontal {{
-                background: {rgba(theme['accent'], opacity * 0.9)};
-                border: 1px solid {rgba(theme['highlight'], opacity * 0.8)};
+                background: {rgba(theme.accent, opacity * 0.9)};
+                border: 1px solid {rgba(theme.highlight, opacity * 0.8)};
                 width: 18px;
                 margin: -5px 0;
                 border-radius: 9px;
             }}
             
             QSpinBox, QComboBox {{
-                background-color: {rgba(theme['secondary'], opacity * 0.8)};
-                color: {rgba(theme['text'], 1.0)};
-                border: 1px solid {rgba(theme['accent'], opacity * 0.5)};
+                background-color: {rgba(theme.secondary, opacity * 0.8)};
+                color: {rgba(theme.text, 1.0)};
+                border: 1px solid {rgba(theme.accent, opacity * 0.5)};
                 border-radius: 4px;
                 padding: 5px;
             }}
             
             QLabel {{
                 background-color: transparent;
-                color: {rgba(theme['text'], 1.0)};
+                color: {rgba(theme.text, 1.0)};
             }}
         """
     
@@ -900,29 +753,129 @@ class ThemeManager:
         return list(self.themes.keys())
 
 
+def _particle_table(count, angle_step, base_radius, radius_step, max_alpha, size_span, dpr=1.0):
+    """Precompute orbiting particles at rotation angle 0, bucketed by size
+    
+    Returns [(size, half_size, [(x, y, sprite), ...]), ...]; each particle is a
+    pre-rendered bright green dot since every particle has a distinct alpha.
+    """
+    buckets = {}
+    for i in range(count):
+        angle = radians(i * angle_step)
+        radius = base_radius + i * radius_step
+        fade = 1 - i / count
+        size = 2 + int(size_span * fade)
+        
+        sprite = QPixmap(QSize(size, size) * dpr)
+        sprite.setDevicePixelRatio(dpr)
+        sprite.fill(Qt.transparent)
+        painter = QPainter(sprite)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(0, 255, 100, int(max_alpha * fade)))
+        painter.drawEllipse(0, 0, size, size)
+        painter.end()
+        
+        buckets.setdefault(size, []).append((radius * cos(angle), radius * sin(angle), sprite))
+    return [(size, size // 2, members) for size, members in sorted(buckets.items())]
+
+
+def _orbit_particles(particles, angle, width, height):
+    """Rotate a particle table by angle (degrees) about the center
+    
+    Returns [(x, y, sprite), ...] top-left positions of the visible particles.
+    """
+    theta = radians(angle)
+    cos_t, sin_t = cos(theta), sin(theta)
+    cx, cy = width // 2, height // 2
+    
+    visible = []
+    for size, half, members in particles:
+        for px, py, sprite in members:
+            x = cx + int(px * cos_t - py * sin_t)
+            y = cy + int(px * sin_t + py * cos_t)
+            
+            if 0 <= x < width and 0 <= y < height:
+                visible.append((x - half, y - half, sprite))
+    return visible
+
+
 class SplashScreen(QSplashScreen):
     """Glassmorphic professional splash screen - Algo Science Lab"""
     
+    # Logo circle geometry shared by the logo and branding sections
+    LOGO_Y = 90
+    LOGO_CIRCLE_SIZE = 140
+    
     def __init__(self):
         # Modern glassmorphic splash dimensions
         pixmap = QPixmap(850, 550)
         super().__init__(pixmap)
         
         self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint)
+        # paintEvent fills the whole rect, so Qt can skip erasing the background
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WA_NoSystemBackground)
         self.progress = 0
         self.message = "Initializing..."
         self.animation_frame = 0
         self.fade_opacity = 0  # Smooth fade-in
         self.pulse_value = 0
+        self._last_fade = None  # Values from the last paint, used to skip no-op repaints
+        self._last_progress = None
+        
+        # Card, branding and border never change; rendered once on first paint
+        self._static_layer = None
+        
+        # Particle offsets are rotated as a whole each frame
+        self._particles = _particle_table(40, 9, 120, 6, 120, 4, self.devicePixelRatioF())
+        
+        # Fonts used by the static layer and the loading message
+        self._font_org = QFont("Arial", 13, QFont.Bold)
+        self._font_product = QFont("Arial", 44, QFont.Bold)
+        self._font_tagline = QFont("Arial", 12, QFont.Normal)
+        self._font_badge = QFont("Arial", 9, QFont.Bold)
+        self._font_msg = QFont("Arial", 10, QFont.Normal)
+        self._font_copy = QFont("Arial", 8, QFont.Normal)
+        
+        # (message, pixmap) of the last rendered loading message
+        self._message_cache = None
+        
+        # Logo glow rendered once on first paint
+        self._logo_glow = None
+        
+        # Waveform icon paths keyed by animation phase (frame % 60)
+        self._wave_paths = {}
+        
+        # Reused for the per-frame progress glow
+        self._glow_color = QColor(0, 255, 100)
+        self._glow_brush = QBrush(self._glow_color)
+        
+        # Pens reused every frame instead of rebuilt per paint
+        self._no_pen = QPen(Qt.NoPen)
+        self._circle_pen = QPen(QColor(0, 255, 100, 150), 3)
+        self._arc_pen = QPen(QColor(100, 255, 150, 180), 2)
+        self._wave_pen = QPen(QColor(0, 255, 100), 4, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        self._wave_glow_pen = QPen(QColor(100, 255, 150, 180), 8, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        self._bar_pen = QPen(QColor(100, 255, 150, 80), 1)
         
         # Center the splash screen on the display
         self.center_on_screen()
         
-        # Professional animation timer
+        # Professional animation timer (runs only while visible)
         self.timer = QTimer()
         self.timer.timeout.connect(self.animate)
+    
+    def showEvent(self, event):
+        """Start animating when shown"""
+        super().showEvent(event)
         self.timer.start(30)
     
+    def hideEvent(self, event):
+        """Stop animating while hidden"""
+        self.timer.stop()
+        super().hideEvent(event)
+    
     def center_on_screen(self):
         """Center the splash screen on the primary screen"""
         screen = QApplication.primaryScreen().geometry()
@@ -932,14 +885,19 @@ class SplashScreen(QSplashScreen):
         
     def animate(self):
         """Smooth animations for glassmorphic effects"""
+        if not self.isVisible():
+            return
         self.animation_frame += 1
         if self.fade_opacity < 1.0:
             self.fade_opacity = min(1.0, self.fade_opacity + 0.03)
         
         # Smooth pulse for glow effects
-        import math
-        self.pulse_value = 0.5 + 0.5 * math.sin(self.animation_frame * 0.05)
-        self.repaint()
+        self.pulse_value = 0.5 + 0.5 * sin(self.animation_frame * 0.05)
+        
+        # Fade and progress repaint immediately; particles and pulse run at half rate
+        if (self.fade_opacity != self._last_fade or self.progress != self._last_progress
+                or self.animation_frame % 2 == 0):
+            self.update()
         
     def paintEvent(self, event):
         """Glassmorphic professional splash screen with stunning details"""
@@ -948,27 +906,81 @@ class SplashScreen(QSplashScreen):
         painter.setRenderHint(QPainter.TextAntialiasing)
         painter.setRenderHint(QPainter.SmoothPixmapTransform)
         
+        # Only touch pixels Qt asked us to repaint
+        region = event.region()
+        painter.setClipRegion(region)
+        
+        # === DEEP BLACK BACKGROUND ===
+        # Particles move under the translucent card, so the dirty area is cleared each frame.
+        # The widget is opaque-painted, so the clear must be at full opacity, before the fade.
+        painter.fillRect(region.boundingRect(), Qt.black)
+        
         # Apply fade-in opacity
         painter.setOpacity(self.fade_opacity)
+        self._last_fade = self.fade_opacity
+        self._last_progress = self.progress
         
-        # === DEEP BLACK BACKGROUND ===
-        painter.fillRect(self.rect(), QColor(0, 0, 0))
+        self._paint_particles(painter)
         
-        # === ANIMATED BACKGROUND PARTICLES (BRIGHT GREEN) ===
-        import math
-        painter.setPen(Qt.NoPen)
-        for i in range(40):
-            angle = (self.animation_frame * 0.008 + i * 9) % 360
-            radius = 120 + i * 6
-            x = self.width() // 2 + int(radius * math.cos(math.radians(angle)))
-            y = self.height() // 2 + int(radius * math.sin(math.radians(angle)))
-            
-            if 0 <= x < self.width() and 0 <= y < self.height():
-                alpha = int(120 * (1 - i / 40))
-                size = 2 + int(4 * (1 - i / 40))
-                painter.setBrush(QColor(0, 255, 100, alpha))  # Bright green particles
-                painter.drawEllipse(x - size//2, y - size//2, size, size)
+        # Static card, branding and border, drawn over the particles
+        if self._static_layer is None:
+            self._static_layer = self._build_static_layer()
+        painter.drawPixmap(0, 0, self._static_layer)
         
+        if region.intersects(self._logo_rect()):
+            self._paint_logo(painter)
+        if region.intersects(self._progress_rect()):
+            self._paint_progress(painter)
+    
+    def _build_static_layer(self):
+        """Render the parts of the splash that never change into a transparent pixmap"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        self._paint_card(painter)
+        self._paint_branding(painter)
+        self._paint_footer(painter)
+        painter.end()
+        return pixmap
+    
+    def _paint_footer(self, painter):
+        """Draw the copyright line and the outer border"""
+        # Copyright with subtle style - BRIGHT TEXT
+        copyright_y = self.height() - 35
+        painter.setPen(QColor(150, 255, 150))  # Bright green
+        painter.setFont(self._font_copy)
+        painter.drawText(0, copyright_y, self.width(), 15, Qt.AlignCenter, 
+                        "© 2025 Algo Science Lab. All rights reserved.")
+        
+        # Outer glassmorphic border - BRIGHT GREEN
+        painter.setPen(QPen(QColor(0, 255, 100, 100), 2))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRoundedRect(0, 0, self.width() - 1, self.height() - 1, 15, 15)
+    
+    def _logo_rect(self):
+        """Area covered by the logo glow and the sliding waveform glow"""
+        logo_circle_x = self.width() // 2 - self.LOGO_CIRCLE_SIZE // 2
+        return QRect(logo_circle_x - 70, self.LOGO_Y - 15,
+                     self.LOGO_CIRCLE_SIZE + 85, self.LOGO_CIRCLE_SIZE + 30)
+    
+    def _progress_rect(self):
+        """Area covered by the progress bar, its glow and the loading message"""
+        return QRect(0, self.height() - 118, self.width(), 60)
+    
+    def _paint_particles(self, painter):
+        """Draw the animated background particles"""
+        # === ANIMATED BACKGROUND PARTICLES (BRIGHT GREEN) ===
+        for x, y, sprite in _orbit_particles(self._particles, self.animation_frame * 0.008,
+                                             self.width(), self.height()):
+            painter.drawPixmap(x, y, sprite)
+    
+    def _paint_card(self, painter):
+        """Draw the glass card and its top accent bar"""
         # === GLASSMORPHIC MAIN CARD (DARK WITH BRIGHT BORDER) ===
         card_margin = 40
         card_rect = self.rect().adjusted(card_margin, card_margin, -card_margin, -card_margin)
@@ -983,7 +995,7 @@ class SplashScreen(QSplashScreen):
         painter.setPen(QPen(QColor(0, 255, 100, 120), 3))  # Bright green border
         painter.drawRoundedRect(card_rect, 20, 20)
         
-        # Inner glow for glass effect
+        # Inner glow for glass effect; part of the static layer, so drawn only once
         for i in range(3):
             alpha = int((3 - i) * 30)
             painter.setPen(QPen(QColor(0, 255, 100, alpha), (3 - i) * 2))
@@ -1000,21 +1012,23 @@ class SplashScreen(QSplashScreen):
         painter.setPen(Qt.NoPen)
         painter.setBrush(accent_gradient)
         painter.drawRoundedRect(card_margin, card_margin, self.width() - card_margin * 2, accent_height, 3, 3)
-        
+    
+    def _paint_logo(self, painter):
+        """Draw the pulsing logo circle with the animated waveform"""
         # === LOGO SECTION WITH GLASSMORPHIC CIRCLE ===
-        logo_y = 90
+        logo_y = self.LOGO_Y
         center_x = self.width() // 2
         
         # Glassmorphic circle background for logo
-        logo_circle_size = 140
+        logo_circle_size = self.LOGO_CIRCLE_SIZE
         logo_circle_x = center_x - logo_circle_size // 2
         
-        # Outer glow - BRIGHT GREEN
-        for i in range(15, 0, -1):
-            alpha = int(i * 3 * self.pulse_value)
-            painter.setBrush(QColor(0, 255, 100, alpha))
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(logo_circle_x - i, logo_y - i, logo_circle_size + i*2, logo_circle_size + i*2)
+        # Outer glow - BRIGHT GREEN, pre-rendered and pulsed through the painter opacity
+        if self._logo_glow is None:
+            self._logo_glow = self._build_logo_glow()
+        painter.setOpacity(self.fade_opacity * self.pulse_value)
+        painter.drawPixmap(logo_circle_x - 15, logo_y - 15, self._logo_glow)
+        painter.setOpacity(self.fade_opacity)
         
         # Glass circle - DARK with bright green gradient
         circle_gradient = QRadialGradient(center_x, logo_y + logo_circle_size // 2, logo_circle_size // 2)
@@ -1023,55 +1037,78 @@ class SplashScreen(QSplashScreen):
         circle_gradient.setColorAt(1, QColor(10, 10, 10, 220))
         
         painter.setBrush(circle_gradient)
-        painter.setPen(QPen(QColor(0, 255, 100, 150), 3))  # Bright green border
+        painter.setPen(self._circle_pen)  # Bright green border
         painter.drawEllipse(logo_circle_x, logo_y, logo_circle_size, logo_circle_size)
         
         # Inner highlight - BRIGHT
-        painter.setPen(QPen(QColor(100, 255, 150, 180), 2))
+        painter.setPen(self._arc_pen)
         painter.setBrush(Qt.NoBrush)
         painter.drawArc(logo_circle_x + 10, logo_y + 10, logo_circle_size - 20, logo_circle_size - 20, 45 * 16, 120 * 16)
         
         # === WAVEFORM ICON (DIGITAL SIGNAL - BRIGHT GREEN) ===
-        wave_pen = QPen(QColor(0, 255, 100), 4, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-        painter.setPen(wave_pen)
-        
         wave_start_x = logo_circle_x + 25
         wave_width = logo_circle_size - 50
         wave_y_center = logo_y + logo_circle_size // 2
         
-        # Animated digital waveform
-        wave_offset = (self.animation_frame % 60) * 1.5
-        wave_path = QPainterPath()
-        wave_path.moveTo(wave_start_x - wave_offset, wave_y_center + 20)
-        
-        for i in range(0, int(wave_width + wave_offset), 20):
-            x_pos = wave_start_x + i - wave_offset
-            if i % 40 < 20:
-                wave_path.lineTo(x_pos, wave_y_center + 20)
-                wave_path.lineTo(x_pos, wave_y_center - 20)
-            else:
-                wave_path.lineTo(x_pos, wave_y_center - 20)
-                wave_path.lineTo(x_pos, wave_y_center + 20)
-        
-        painter.setClipRect(logo_circle_x + 20, logo_y + 20, logo_circle_size - 40, logo_circle_size - 40)
+        # Animated digital waveform (one cached path per animation phase)
+        phase = self.animation_frame % 60
+        wave_path = self._wave_paths.get(phase)
+        if wave_path is None:
+            wave_offset = phase * 1.5
+            wave_path = QPainterPath()
+            wave_path.moveTo(wave_start_x - wave_offset, wave_y_center + 20)
+            
+            for i in range(0, int(wave_width + wave_offset), 20):
+                x_pos = wave_start_x + i - wave_offset
+                if i % 40 < 20:
+                    wave_path.lineTo(x_pos, wave_y_center + 20)
+                    wave_path.lineTo(x_pos, wave_y_center - 20)
+                else:
+                    wave_path.lineTo(x_pos, wave_y_center - 20)
+                    wave_path.lineTo(x_pos, wave_y_center + 20)
+            self._wave_paths[phase] = wave_path
+        
+        # Intersect with (not replace) the paint region clip
+        painter.save()
+        painter.setPen(self._wave_pen)
+        painter.setClipRect(logo_circle_x + 20, logo_y + 20, logo_circle_size - 40, logo_circle_size - 40,
+                            Qt.IntersectClip)
         painter.drawPath(wave_path)
-        painter.setClipping(False)
+        painter.restore()
         
         # Glow effect on waveform - VERY BRIGHT
-        glow_pen = QPen(QColor(100, 255, 150, 180), 8, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-        painter.setPen(glow_pen)
+        painter.setPen(self._wave_glow_pen)
         painter.drawPath(wave_path)
-        
+    
+    def _build_logo_glow(self):
+        """Render the 15-ring logo glow at full pulse into a transparent pixmap"""
+        size = self.LOGO_CIRCLE_SIZE + 30
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(QSize(size, size) * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        for i in range(15, 0, -1):
+            painter.setBrush(QColor(0, 255, 100, i * 3))
+            painter.drawEllipse(15 - i, 15 - i, self.LOGO_CIRCLE_SIZE + i*2, self.LOGO_CIRCLE_SIZE + i*2)
+        painter.end()
+        return pixmap
+    
+    def _paint_branding(self, painter):
+        """Draw organization, product name, tagline and version badge"""
         # === BRANDING TEXT SECTION - BRIGHT COLORS ===
-        text_y = logo_y + logo_circle_size + 50
+        center_x = self.width() // 2
+        text_y = self.LOGO_Y + self.LOGO_CIRCLE_SIZE + 50
         
         # Organization name with glow
         painter.setPen(QColor(0, 0, 0, 100))
-        painter.setFont(QFont("Arial", 13, QFont.Bold))
+        painter.setFont(self._font_org)
         painter.drawText(0, text_y + 1, self.width(), 20, Qt.AlignCenter, "ALGO SCIENCE LAB")
         
         painter.setPen(QColor(100, 255, 150))  # Bright green
-        painter.setFont(QFont("Arial", 13, QFont.Bold))
         painter.drawText(0, text_y, self.width(), 20, Qt.AlignCenter, "ALGO SCIENCE LAB")
         
         # Decorative line
@@ -1090,17 +1127,16 @@ class SplashScreen(QSplashScreen):
         # Product name (large, bold) with shadow
         product_y = line_y + 25
         painter.setPen(QColor(0, 0, 0, 120))
-        painter.setFont(QFont("Arial", 44, QFont.Bold))
+        painter.setFont(self._font_product)
         painter.drawText(0, product_y + 2, self.width(), 50, Qt.AlignCenter, "AWaveViewer")
         
         painter.setPen(QColor(255, 255, 255))  # Pure white
-        painter.setFont(QFont("Arial", 44, QFont.Bold))
         painter.drawText(0, product_y, self.width(), 50, Qt.AlignCenter, "AWaveViewer")
         
         # Tagline
         tagline_y = product_y + 55
         painter.setPen(QColor(200, 255, 200))  # Very light green
-        painter.setFont(QFont("Arial", 12, QFont.Normal))
+        painter.setFont(self._font_tagline)
         painter.drawText(0, tagline_y, self.width(), 20, Qt.AlignCenter, 
                         "Professional Verilog Waveform Analyzer")
         
@@ -1121,15 +1157,17 @@ class SplashScreen(QSplashScreen):
         
         # Badge text
         painter.setPen(QColor(255, 255, 255))  # Pure white
-        painter.setFont(QFont("Arial", 9, QFont.Bold))
+        painter.setFont(self._font_badge)
         painter.drawText(badge_x, version_y, badge_width, badge_height, Qt.AlignCenter, 
                         "Version 1.0 • Professional Edition")
-        
+    
+    def _paint_progress(self, painter):
+        """Draw the progress bar and the loading message"""
         # === GLASSMORPHIC PROGRESS BAR - BRIGHT GREEN ===
         progress_y = self.height() - 110
         bar_width = 550
         bar_height = 6
-        bar_x = center_x - bar_width // 2
+        bar_x = self.width() // 2 - bar_width // 2
         
         # Progress bar glass background
         bar_bg_gradient = QLinearGradient(bar_x, progress_y, bar_x, progress_y + bar_height)
@@ -1137,7 +1175,7 @@ class SplashScreen(QSplashScreen):
         bar_bg_gradient.setColorAt(1, QColor(30, 30, 30, 150))
         
         painter.setBrush(bar_bg_gradient)
-        painter.setPen(QPen(QColor(100, 255, 150, 80), 1))
+        painter.setPen(self._bar_pen)
         painter.drawRoundedRect(bar_x, progress_y, bar_width, bar_height, 3, 3)
         
         # Progress fill with gradient and glow
@@ -1149,14 +1187,17 @@ class SplashScreen(QSplashScreen):
             progress_gradient.setColorAt(0.5, QColor(50, 255, 150))
             progress_gradient.setColorAt(1, QColor(0, 200, 80))
             
-            # Glow under progress
+            # Glow under progress (every fill below is unstroked)
+            painter.setPen(self._no_pen)
+            glow_color = self._glow_color
+            glow_brush = self._glow_brush
             for i in range(3, 0, -1):
-                painter.setPen(Qt.NoPen)
-                painter.setBrush(QColor(0, 255, 100, 50 * i))
+                glow_color.setAlpha(50 * i)
+                glow_brush.setColor(glow_color)
+                painter.setBrush(glow_brush)
                 painter.drawRoundedRect(bar_x - i, progress_y - i, progress_width + i*2, bar_height + i*2, 3, 3)
             
             painter.setBrush(progress_gradient)
-            painter.setPen(Qt.NoPen)
             painter.drawRoundedRect(bar_x, progress_y, progress_width, bar_height, 3, 3)
             
             # Shine effect on progress
@@ -1169,32 +1210,37 @@ class SplashScreen(QSplashScreen):
         
         # Loading message - BRIGHT TEXT
         message_y = progress_y + 22
+        painter.drawPixmap(0, message_y, self._message_pixmap())
+    
+    def _message_pixmap(self):
+        """Loading message with its shadow baked in, re-rendered only when the text changes"""
+        if self._message_cache is not None and self._message_cache[0] == self.message:
+            return self._message_cache[1]
+        
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(QSize(self.width(), 21) * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.setFont(self._font_msg)
         painter.setPen(QColor(0, 0, 0, 100))
-        painter.setFont(QFont("Arial", 10, QFont.Normal))
-        painter.drawText(0, message_y + 1, self.width(), 20, Qt.AlignCenter, self.message)
+        painter.drawText(0, 1, self.width(), 20, Qt.AlignCenter, self.message)
         
         painter.setPen(QColor(200, 255, 200))  # Very bright green
-        painter.setFont(QFont("Arial", 10, QFont.Normal))
-        painter.drawText(0, message_y, self.width(), 20, Qt.AlignCenter, self.message)
-        
-        # Copyright with subtle style - BRIGHT TEXT
-        copyright_y = self.height() - 35
-        painter.setPen(QColor(150, 255, 150))  # Bright green
-        painter.setFont(QFont("Arial", 8, QFont.Normal))
-        painter.drawText(0, copyright_y, self.width(), 15, Qt.AlignCenter, 
-                        "© 2025 Algo Science Lab. All rights reserved.")
+        painter.drawText(0, 0, self.width(), 20, Qt.AlignCenter, self.message)
+        painter.end()
         
-        # Outer glassmorphic border - BRIGHT GREEN
-        painter.setPen(QPen(QColor(0, 255, 100, 100), 2))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRoundedRect(0, 0, self.width() - 1, self.height() - 1, 15, 15)
+        self._message_cache = (self.message, pixmap)
+        return pixmap
     
     def set_progress(self, value, message=""):
         """Update progress and message"""
         self.progress = value
         if message:
             self.message = message
-        self.repaint()
+        self.update(self._progress_rect())
     
     def closeEvent(self, event):
         """Stop animation timer when closing"""
@@ -1205,12 +1251,97 @@ class SplashScreen(QSplashScreen):
 class WelcomeDialog(QDialog):
     """Glassmorphic professional welcome screen - Algo Science Lab"""
     
+    # Styling for all welcome screen children, selected by object name
+    STYLESHEET = """
+        QFrame#welcomeContainer, QWidget#featuresContainer,
+        QWidget#footerContainer, QWidget#buttonContainer {
+            background: transparent;
+        }
+        QLabel#orgLabel, QLabel#productLabel, QLabel#versionLabel, QLabel#taglineLabel,
+        QLabel#featuresLabel, QLabel#creatorLabel, QLabel#copyrightLabel {
+            font-family: 'Arial';
+            background: transparent;
+        }
+        QLabel#orgLabel {
+            color: rgb(0, 255, 100);
+            font-size: 10px;
+            font-weight: 700;
+            letter-spacing: 2px;
+        }
+        QLabel#productLabel {
+            color: rgb(255, 255, 255);
+            font-size: 48px;
+            font-weight: 800;
+        }
+        QLabel#versionLabel {
+            color: rgb(150, 255, 150);
+            font-size: 11px;
+            font-weight: 600;
+        }
+        QLabel#taglineLabel {
+            color: rgb(180, 180, 180);
+            font-size: 12px;
+            font-weight: 400;
+        }
+        QFrame#separator {
+            background: rgba(0, 255, 100, 80);
+        }
+        QLabel#creatorLabel {
+            color: rgb(180, 180, 180);
+            font-size: 11px;
+            font-weight: 500;
+        }
+        QLabel#copyrightLabel {
+            color: rgb(120, 120, 120);
+            font-size: 9px;
+            font-weight: 400;
+        }
+        QPushButton#closeBtn {
+            background: transparent;
+            color: rgb(180, 180, 180);
+            border: 1px solid rgba(100, 100, 100, 150);
+            border-radius: 6px;
+            font-size: 13px;
+            font-weight: 600;
+            font-family: 'Arial';
+        }
+        QPushButton#closeBtn:hover {
+            color: rgb(220, 220, 220);
+            border: 1px solid rgba(150, 150, 150, 200);
+        }
+        QPushButton#closeBtn:pressed {
+            background: rgba(50, 50, 50, 100);
+        }
+        QPushButton#startBtn {
+            background: rgb(0, 255, 100);
+            color: rgb(0, 0, 0);
+            border: none;
+            border-radius: 6px;
+            font-size: 13px;
+            font-weight: 700;
+            font-family: 'Arial';
+        }
+        QPushButton#startBtn:hover {
+            background: rgb(50, 255, 150);
+        }
+        QPushButton#startBtn:pressed {
+            background: rgb(0, 200, 80);
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Welcome to AWaveViewer")
         self.setFixedSize(900, 680)
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
+        # paintEvent fills the whole rect, so Qt can skip erasing the background
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WA_NoSystemBackground)
         self.animation_frame = 0
+        self._border_layer = None  # Border glow rendered once on first paint
+        # Bright green border glow rings, outermost (widest) first
+        self._glow_pens = [QPen(QColor(0, 255, 100, i * 12), i * 2) for i in range(8, 0, -1)]
+        self._particles = _particle_table(35, 10.3, 100, 7, 100, 3, self.devicePixelRatioF())
         self.setup_ui()
         
         # Center the dialog on screen
@@ -1223,11 +1354,20 @@ class WelcomeDialog(QDialog):
         shadow.setOffset(0, 8)
         self.setGraphicsEffect(shadow)
         
-        # Start animation for glassmorphic effects
+        # Animation for glassmorphic effects (runs only while visible)
         self.timer = QTimer()
         self.timer.timeout.connect(self.animate)
+    
+    def showEvent(self, event):
+        """Start animating when shown"""
+        super().showEvent(event)
         self.timer.start(50)
     
+    def hideEvent(self, event):
+        """Stop animating while hidden"""
+        self.timer.stop()
+        super().hideEvent(event)
+    
     def center_on_screen(self):
         """Center the dialog on the primary screen"""
         screen = QApplication.primaryScreen().geometry()
@@ -1237,6 +1377,8 @@ class WelcomeDialog(QDialog):
     
     def animate(self):
         """Animate glassmorphic effects"""
+        if not self.isVisible():
+            return
         self.animation_frame += 1
         self.update()
     
@@ -1245,45 +1387,58 @@ class WelcomeDialog(QDialog):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Deep black background
-        painter.fillRect(self.rect(), QColor(0, 0, 0))
+        # Only touch pixels Qt asked us to repaint
+        region = event.region()
+        painter.setClipRegion(region)
+        
+        # Deep black background (particles move, so the dirty area is cleared each frame)
+        painter.fillRect(region.boundingRect(), Qt.black)
         
         # Animated particles - BRIGHT GREEN
-        import math
-        painter.setPen(Qt.NoPen)
-        for i in range(35):
-            angle = (self.animation_frame * 0.5 + i * 10.3) % 360
-            radius = 100 + i * 7
-            x = self.width() // 2 + int(radius * math.cos(math.radians(angle)))
-            y = self.height() // 2 + int(radius * math.sin(math.radians(angle)))
-            
-            if 0 <= x < self.width() and 0 <= y < self.height():
-                alpha = int(100 * (1 - i / 35))
-                size = 2 + int(3 * (1 - i / 35))
-                painter.setBrush(QColor(0, 255, 100, alpha))  # Bright green
-                painter.drawEllipse(x - size//2, y - size//2, size, size)
+        for x, y, sprite in _orbit_particles(self._particles, self.animation_frame * 0.5,
+                                             self.width(), self.height()):
+            painter.drawPixmap(x, y, sprite)
+        
+        # Glassmorphic border glow, drawn over the particles
+        if self._border_layer is None:
+            self._border_layer = self._build_border_layer()
+        painter.drawPixmap(0, 0, self._border_layer)
+        
+        super().paintEvent(event)
+    
+    def _build_border_layer(self):
+        """Render the static border glow into a transparent pixmap"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
         
         # Glassmorphic border glow - BRIGHT GREEN
-        for i in range(8, 0, -1):
-            alpha = int(i * 12)
-            painter.setPen(QPen(QColor(0, 255, 100, alpha), i * 2))  # Bright green glow
-            painter.setBrush(Qt.NoBrush)
+        painter.setBrush(Qt.NoBrush)
+        for i, pen in zip(range(8, 0, -1), self._glow_pens):
+            painter.setPen(pen)
             painter.drawRoundedRect(i, i, self.width() - i*2, self.height() - i*2, 20, 20)
         
         painter.setPen(QPen(QColor(0, 255, 100, 150), 2))  # Bright green border
         painter.drawRoundedRect(1, 1, self.width() - 2, self.height() - 2, 18, 18)
-        
-        super().paintEvent(event)
+        painter.end()
+        return pixmap
     
     def setup_ui(self):
         """Professional and simple welcome screen"""
+        # All child styling lives in one stylesheet, parsed once
+        self.setStyleSheet(self.STYLESHEET)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         
         # Main container
         container = QFrame()
-        container.setStyleSheet("QFrame { background: transparent; }")
+        container.setObjectName("welcomeContainer")
         
         container_layout = QVBoxLayout(container)
         container_layout.setContentsMargins(60, 50, 60, 50)
@@ -1293,60 +1448,35 @@ class WelcomeDialog(QDialog):
         # Organization label
         org_label = QLabel("🔬 ALGO SCIENCE LAB")
         org_label.setAlignment(Qt.AlignCenter)
-        org_label.setStyleSheet("""
-            color: rgb(0, 255, 100);
-            font-size: 10px;
-            font-weight: 700;
-            letter-spacing: 2px;
-            font-family: 'Arial';
-            background: transparent;
-        """)
+        org_label.setObjectName("orgLabel")
         container_layout.addWidget(org_label)
         container_layout.addSpacing(12)
         
         # Product name
         product_label = QLabel("AWaveViewer")
         product_label.setAlignment(Qt.AlignCenter)
-        product_label.setStyleSheet("""
-            color: rgb(255, 255, 255);
-            font-size: 48px;
-            font-weight: 800;
-            font-family: 'Arial';
-            background: transparent;
-        """)
+        product_label.setObjectName("productLabel")
         container_layout.addWidget(product_label)
         container_layout.addSpacing(8)
         
         # Version
         version_label = QLabel("Version 1.0 Professional")
         version_label.setAlignment(Qt.AlignCenter)
-        version_label.setStyleSheet("""
-            color: rgb(150, 255, 150);
-            font-size: 11px;
-            font-weight: 600;
-            font-family: 'Arial';
-            background: transparent;
-        """)
+        version_label.setObjectName("versionLabel")
         container_layout.addWidget(version_label)
         container_layout.addSpacing(6)
         
         # Tagline
         tagline_label = QLabel("Professional Verilog Waveform Analyzer & Verification Suite")
         tagline_label.setAlignment(Qt.AlignCenter)
-        tagline_label.setStyleSheet("""
-            color: rgb(180, 180, 180);
-            font-size: 12px;
-            font-weight: 400;
-            font-family: 'Arial';
-            background: transparent;
-        """)
+        tagline_label.setObjectName("taglineLabel")
         container_layout.addWidget(tagline_label)
         
         # Separator line
         container_layout.addSpacing(35)
         separator = QFrame()
         separator.setFixedHeight(1)
-        separator.setStyleSheet("background: rgba(0, 255, 100, 80);")
+        separator.setObjectName("separator")
         container_layout.addWidget(separator)
         container_layout.addSpacing(30)
         
@@ -1364,78 +1494,46 @@ class WelcomeDialog(QDialog):
         
         # Features list container
         features_container = QWidget()
-        features_container.setStyleSheet("background: transparent;")
+        features_container.setObjectName("featuresContainer")
         features_layout = QVBoxLayout(features_container)
         features_layout.setSpacing(12)
         features_layout.setContentsMargins(80, 0, 80, 0)
         
-        for checkmark, feature_text in features_data:
-            feature_row = QWidget()
-            feature_row.setStyleSheet("background: transparent;")
-            feature_row_layout = QHBoxLayout(feature_row)
-            feature_row_layout.setContentsMargins(0, 0, 0, 0)
-            feature_row_layout.setSpacing(15)
-            
-            # Checkmark
-            check_label = QLabel(checkmark)
-            check_label.setStyleSheet("""
-                QLabel {
-                    color: rgb(0, 255, 100);
-                    font-size: 16px;
-                    font-weight: 700;
-                    font-family: 'Arial';
-                    background: transparent;
-                }
-            """)
-            check_label.setFixedWidth(20)
-            feature_row_layout.addWidget(check_label)
-            
-            # Feature text
-            feature_label = QLabel(feature_text)
-            feature_label.setStyleSheet("""
-                QLabel {
-                    color: rgb(220, 220, 220);
-                    font-size: 13px;
-                    font-weight: 400;
-                    font-family: 'Arial';
-                    background: transparent;
-                }
-            """)
-            feature_row_layout.addWidget(feature_label, 1)
-            
-            features_layout.addWidget(feature_row)
+        # One rich-text label instead of a QWidget + layout + 2 labels per row
+        rows = []
+        for index, (checkmark, feature_text) in enumerate(features_data):
+            row_gap = "" if index == len(features_data) - 1 else " padding-bottom: 12px;"
+            rows.append(
+                f"<tr><td width='20' style='color: rgb(0, 255, 100); font-size: 16px;"
+                f" font-weight: 700;{row_gap}'>{checkmark}</td>"
+                f"<td style='color: rgb(220, 220, 220); font-size: 13px; font-weight: 400;"
+                f" padding-left: 15px;{row_gap}'>{feature_text}</td></tr>"
+            )
+        features_label = QLabel()
+        features_label.setTextFormat(Qt.RichText)
+        features_label.setText("<table cellspacing='0' cellpadding='0'>" + "".join(rows) + "</table>")
+        features_label.setObjectName("featuresLabel")
+        features_layout.addWidget(features_label)
         
         container_layout.addWidget(features_container)
         container_layout.addSpacing(40)
         
         # === FOOTER INFO ===
         footer_container = QWidget()
-        footer_container.setStyleSheet("background: transparent;")
+        footer_container.setObjectName("footerContainer")
         footer_layout = QVBoxLayout(footer_container)
         footer_layout.setSpacing(6)
         
         # Creator info
         creator_label = QLabel("Created by Shahrear Hossain Shawon")
         creator_label.setAlignment(Qt.AlignCenter)
-        creator_label.setStyleSheet("""
-            color: rgb(180, 180, 180);
-            font-size: 11px;
-            font-weight: 500;
-            font-family: 'Arial';
-            background: transparent;
-        """)
+        creator_label.setObjectName("creatorLabel")
         footer_layout.addWidget(creator_label)
         
         # Copyright
         copyright_label = QLabel("© 2025 Algo Science Lab • All rights reserved")
         copyright_label.setAlignment(Qt.AlignCenter)
-        copyright_label.setStyleSheet("""
-            color: rgb(120, 120, 120);
-            font-size: 9px;
-            font-weight: 400;
-            font-family: 'Arial';
-            background: transparent;
-        """)
+        copyright_label.setObjectName("copyrightLabel")
         footer_layout.addWidget(copyright_label)
         
         container_layout.addWidget(footer_container)
@@ -1443,7 +1541,7 @@ class WelcomeDialog(QDialog):
         
         # === BUTTONS ===
         button_container = QWidget()
-        button_container.setStyleSheet("background: transparent;")
+        button_container.setObjectName("buttonContainer")
         button_layout = QHBoxLayout(button_container)
         button_layout.setSpacing(15)
         button_layout.addStretch()
@@ -1452,24 +1550,7 @@ class WelcomeDialog(QDialog):
         close_btn = QPushButton("Close")
         close_btn.setFixedSize(120, 40)
         close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: rgb(180, 180, 180);
-                border: 1px solid rgba(100, 100, 100, 150);
-                border-radius: 6px;
-                font-size: 13px;
-                font-weight: 600;
-                font-family: 'Arial';
-            }
-            QPushButton:hover {
-                color: rgb(220, 220, 220);
-                border: 1px solid rgba(150, 150, 150, 200);
-            }
-            QPushButton:pressed {
-                background: rgba(50, 50, 50, 100);
-            }
-        """)
+        close_btn.setObjectName("closeBtn")
         close_btn.clicked.connect(self.reject)
         button_layout.addWidget(close_btn)
         
@@ -1477,23 +1558,7 @@ class WelcomeDialog(QDialog):
         start_btn = QPushButton("Get Started")
         start_btn.setFixedSize(150, 40)
         start_btn.setCursor(Qt.PointingHandCursor)
-        start_btn.setStyleSheet("""
-            QPushButton {
-                background: rgb(0, 255, 100);
-                color: rgb(0, 0, 0);
-                border: none;
-                border-radius: 6px;
-                font-size: 13px;
-                font-weight: 700;
-                font-family: 'Arial';
-            }
-            QPushButton:hover {
-                background: rgb(50, 255, 150);
-            }
-            QPushButton:pressed {
-                background: rgb(0, 200, 80);
-            }
-        """)
+        start_btn.setObjectName("startBtn")
         start_btn.clicked.connect(self.accept)
         button_layout.addWidget(start_btn)
         
@@ -1504,6 +1569,90 @@ class WelcomeDialog(QDialog):
         layout.addWidget(container)
 
 
+# Verilog and VCD patterns, compiled once at import
+_RE_MODULE_DECL = re.compile(r'\bmodule\s+\w+')
+# Block keywords counted in one pass; 'module' must be followed by whitespace.
+# The rest share prefixes (end/endcase/endmodule, case/casex/casez), so they go through a trie.
+_RE_TOKENS = re.compile(r'\b(module(?=\s)|' + _trie_pattern(
+    ('endmodule', 'begin', 'end', 'case', 'casex', 'casez', 'endcase',
+     'function', 'endfunction', 'task', 'endtask')) + r')\b')
+_RE_INVALID_PORT = re.compile(r'(input|output|inout)\s+[^\w\s\[\]]+')
+_RE_MODULE_PORT_LIST = re.compile(r'\bmodule\s+\w+\s*\([^)]*\)\s*;(?!\s*endmodule)')
+_RE_HAS_PORTS = re.compile(r'(input|output|inout)')
+_RE_HAS_LOGIC = re.compile(r'(always|assign|initial|\w+\s+\w+\s*\()')
+# Whole lines (ignoring surrounding whitespace) that start with a declaration keyword
+_RE_DECL_LINE = re.compile(r'^[^\S\n]*(?:input|output|inout|wire|reg|parameter|assign|integer|real)'
+                           r'[^\S\n]+\S[^\n]*$', re.MULTILINE)
+_RE_SLC = re.compile(r'//.*?$', re.MULTILINE)
+_RE_MLC = re.compile(r'/\*.*?\*/', re.DOTALL)
+_RE_SV_FEATURES = re.compile(r'\b(logic|always_ff|always_comb|always_latch|interface|class|package)\b')
+_RE_V2001_FEATURES = re.compile(r'\b(localparam|generate|signed|unsigned)\b')
+_RE_STAR_SENSITIVITY = re.compile(r'@\(\*\)')
+_RE_MODULE_NAME = re.compile(r'module\s+(\w+)')
+_RE_PARAM = re.compile(r'parameter\s+(?:\[.*?\]\s+)?(\w+)\s*=\s*([^;,]+)')
+# Port, wire and reg declarations in one alternation: input may carry 'wire', output 'reg'/'wire',
+# and only ports may be terminated by ')'
+_RE_DECLS = re.compile(
+    r'(?P<kind>(?P<port>(?P<i>input)|(?P<o>output)|inout)|wire|reg)\s+'
+    r'(?(i)(?:wire\s+)?|(?(o)(?:reg|wire\s+)?))'
+    r'(?:\[(?P<msb>\d+):(?P<lsb>\d+)\]\s+)?(?P<name>\w+)\s*(?(port)[,;)]|[,;])'
+)
+_RE_INSTANTIATION = re.compile(r'(\w+)\s*(?:#\s*\([^)]*\))?\s+(\w+)\s*\((.*?)\);', re.DOTALL)
+_RE_PORT_CONNECTION = re.compile(r'\.\s*(\w+)\s*\(\s*(\w+)\s*\)')
+_RE_UUT_INSTANCE = re.compile(r'(\w+)\s+(?:uut|dut|u1|inst|i_\w+)\s*\(')
+_RE_TIMESCALE = re.compile(r'(\d+)\s*(\w+)')
+_UNIT_MAP = {'s': 1e0, 'ms': 1e-3, 'us': 1e-6, 'ns': 1e-9, 'ps': 1e-12, 'fs': 1e-15}
+_SINGLE_BIT_SET = frozenset('01xzXZ')
+
+# Set to True to trace VCD parsing on stdout (very slow on large dumps)
+_DEBUG = False
+
+
+def _vcd_id(n: int) -> str:
+    """Return the n-th VCD identifier code: '!'..'~', then '!!', '!"', ... (bijective base 94)"""
+    chars = []
+    n += 1
+    while n:
+        n -= 1
+        chars.append(chr(33 + n % 94))
+        n //= 94
+    return ''.join(reversed(chars))
+
+
+class _Timeline(Sequence):
+    """List-like sequence of (time, *fields) records stored column-wise, with times packed in an array('q')"""
+    __slots__ = ('times', 'columns')
+    
+    def __init__(self, fields=1):
+        self.times = array('q')
+        self.columns = tuple([] for _ in range(fields))
+    
+    def append(self, record):
+        self.times.append(record[0])
+        for column, value in zip(self.columns, record[1:]):
+            column.append(value)
+    
+    def __len__(self):
+        return len(self.times)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(zip(self.times[index], *[column[index] for column in self.columns]))
+        return (self.times[index], *[column[index] for column in self.columns])
+    
+    def __iter__(self):
+        return zip(self.times, *self.columns)
+
+
+@functools.lru_cache(maxsize=4)
+def _strip_comments(code: str) -> str:
+    """Remove comments from Verilog code, memoized so validate-then-parse strips once"""
+    # Remove single-line comments
+    code = _RE_SLC.sub('', code)
+    # Remove multi-line comments
+    return _RE_MLC.sub('', code)
+
+
 class VerilogSyntaxChecker:
     """Check Verilog syntax and validate code before testbench generation"""
     
@@ -1518,80 +1667,73 @@ class VerilogSyntaxChecker:
         
         # Remove comments to avoid false positives
         code = VerilogSyntaxChecker._remove_comments(verilog_code)
+        lines = code.split('\n')  # Split once, shared by the line-based checks
         
         # Check 1: Module declaration
-        if not re.search(r'\bmodule\s+\w+', code):
+        if not _RE_MODULE_DECL.search(code):
             errors.append("ERROR: No module declaration found")
         
+        # Tally every block keyword in a single scan (casex/casez count as case)
+        counts = Counter(_RE_TOKENS.findall(code))
+        counts['case'] += counts['casex'] + counts['casez']
+        
         # Check 2: Module/endmodule matching
-        module_count = len(re.findall(r'\bmodule\s+', code))
-        endmodule_count = len(re.findall(r'\bendmodule\b', code))
+        module_count = counts['module']
+        endmodule_count = counts['endmodule']
         if module_count != endmodule_count:
             errors.append(f"ERROR: Module/endmodule mismatch (found {module_count} module(s) but {endmodule_count} endmodule(s))")
         
         # Check 3: Begin/end matching
-        begin_count = len(re.findall(r'\bbegin\b', code))
-        end_count = len(re.findall(r'\bend\b', code))
+        begin_count = counts['begin']
+        end_count = counts['end']
         if begin_count != end_count:
             warnings.append(f"WARNING: Begin/end mismatch (found {begin_count} begin(s) but {end_count} end(s))")
         
         # Check 4: Case/endcase matching
-        case_count = len(re.findall(r'\bcase[xz]?\b', code))
-        endcase_count = len(re.findall(r'\bendcase\b', code))
+        case_count = counts['case']
+        endcase_count = counts['endcase']
         if case_count != endcase_count:
             errors.append(f"ERROR: Case/endcase mismatch (found {case_count} case(s) but {endcase_count} endcase(s))")
         
         # Check 5: Function/endfunction matching
-        function_count = len(re.findall(r'\bfunction\b', code))
-        endfunction_count = len(re.findall(r'\bendfunction\b', code))
+        function_count = counts['function']
+        endfunction_count = counts['endfunction']
         if function_count != endfunction_count:
             errors.append(f"ERROR: Function/endfunction mismatch")
         
         # Check 6: Task/endtask matching
-        task_count = len(re.findall(r'\btask\b', code))
-        endtask_count = len(re.findall(r'\bendtask\b', code))
+        task_count = counts['task']
+        endtask_count = counts['endtask']
         if task_count != endtask_count:
             errors.append(f"ERROR: Task/endtask mismatch")
         
-        # Check 7: Parentheses matching
+        # Check 7 & 8: Parentheses and bracket matching in one pass
+        # (a line stops being checked for a kind after its first unmatched closer)
         paren_balance = 0
-        line_num = 0
-        for line in code.split('\n'):
-            line_num += 1
-            for char in line:
-                if char == '(':
-                    paren_balance += 1
-                elif char == ')':
-                    paren_balance -= 1
-                    if paren_balance < 0:
-                        errors.append(f"ERROR: Unmatched closing parenthesis at line {line_num}")
-                        break
+        bracket_balance = 0
+        paren_errors = []
+        bracket_errors = []
+        for line_num, line in enumerate(lines, 1):
+            paren_balance, unmatched = VerilogSyntaxChecker._line_balance(line, paren_balance, '(', ')')
+            if unmatched:
+                paren_errors.append(f"ERROR: Unmatched closing parenthesis at line {line_num}")
+            bracket_balance, unmatched = VerilogSyntaxChecker._line_balance(line, bracket_balance, '[', ']')
+            if unmatched:
+                bracket_errors.append(f"ERROR: Unmatched closing bracket at line {line_num}")
+        errors.extend(paren_errors)
         if paren_balance > 0:
             errors.append(f"ERROR: {paren_balance} unclosed parenthesis/parentheses")
-        
-        # Check 8: Bracket matching
-        bracket_balance = 0
-        line_num = 0
-        for line in code.split('\n'):
-            line_num += 1
-            for char in line:
-                if char == '[':
-                    bracket_balance += 1
-                elif char == ']':
-                    bracket_balance -= 1
-                    if bracket_balance < 0:
-                        errors.append(f"ERROR: Unmatched closing bracket at line {line_num}")
-                        break
+        errors.extend(bracket_errors)
         if bracket_balance > 0:
             errors.append(f"ERROR: {bracket_balance} unclosed bracket(s)")
         
         # Check 9: Invalid port declarations
-        invalid_ports = re.findall(r'(input|output|inout)\s+[^\w\s\[\]]+', code)
+        invalid_ports = _RE_INVALID_PORT.findall(code)
         if invalid_ports:
             warnings.append(f"WARNING: Potentially invalid port declarations found")
         
         # Check 10: Semicolon after module ports (common error)
-        if re.search(r'\bmodule\s+\w+\s*\([^)]*\)\s*;(?!\s*endmodule)', code):
+        if _RE_MODULE_PORT_LIST.search(code):
             # This is valid for Verilog-95 style
             pass
         
@@ -1600,27 +1742,37 @@ class VerilogSyntaxChecker:
             warnings.append(f"INFO: Multiple modules found ({module_count}). Only the first will be used for testbench generation.")
         
         # Check 12: Empty module
-        module_content = re.search(r'module\s+\w+.*?endmodule', code, re.DOTALL)
-        if module_content:
-            content = module_content.group(0)
+        # First module header up to the next endmodule, located with str.find
+        module_head = _RE_MODULE_NAME.search(code)
+        module_end = -1
+        if module_head:
+            module_end = code.find('endmodule', module_head.end())
+            if module_end < 0:
+                # Only a name that itself contains 'endmodule' can still close the module
+                module_end = code.rfind('endmodule', module_head.start(1) + 1)
+        if module_end >= 0:
+            content = code[module_head.start():module_end + 9]
             # Check if module has any ports or internal logic
-            has_ports = bool(re.search(r'(input|output|inout)', content))
-            has_logic = bool(re.search(r'(always|assign|initial|\w+\s+\w+\s*\()', content))
+            has_ports = bool(_RE_HAS_PORTS.search(content))
+            has_logic = bool(_RE_HAS_LOGIC.search(content))
             
             if not has_ports and not has_logic:
                 warnings.append("WARNING: Module appears to be empty (no ports or logic found)")
         
         # Check 13: Common syntax errors
         # Missing semicolons (rough check)
-        lines = code.split('\n')
-        for i, line in enumerate(lines, 1):
-            line = line.strip()
-            if line and not line.startswith('//'):
-                # Check for statements that should end with semicolon
-                if re.match(r'(input|output|inout|wire|reg|parameter|assign|integer|real)\s+', line):
-                    if not line.endswith((';', ',', ')', '(', 'begin', 'end')):
-                        if i < len(lines) and not lines[i].strip().startswith((')', ',')):
-                            warnings.append(f"WARNING: Line {i} might be missing semicolon: {line[:50]}")
+        line_num, line_pos = 1, 0
+        for match in _RE_DECL_LINE.finditer(code):
+            # Check for statements that should end with semicolon
+            line = match.group(0).strip()
+            # (_RE_DECL_LINE already excludes comment lines, which start with '/')
+            if line.endswith((';', ',', ')', '(', 'begin', 'end')):
+                continue
+            # Line numbers are counted incrementally, only for suspicious lines
+            line_num += code.count('\n', line_pos, match.start())
+            line_pos = match.start()
+            if line_num < len(lines) and not lines[line_num].strip().startswith((')', ',')):
+                warnings.append(f"WARNING: Line {line_num} might be missing semicolon: {line[:50]}")
         
         # Combine errors and warnings
         all_messages = errors + warnings
@@ -1628,25 +1780,40 @@ class VerilogSyntaxChecker:
         
         return is_valid, all_messages
     
+    @staticmethod
+    def _line_balance(line: str, balance: int, opener: str, closer: str) -> tuple[int, bool]:
+        """Add one line's opener/closer delta to balance, returning (balance, hit_unmatched_closer)"""
+        closes = line.count(closer)
+        if closes == 0 or closes <= balance:
+            # Balance cannot dip below zero on this line, so str.count is enough
+            return balance + line.count(opener) - closes, False
+        
+        # Hop from closer to closer, counting openers in between; stop at the first unmatched one
+        start = 0
+        pos = line.find(closer)
+        while pos >= 0:
+            balance += line.count(opener, start, pos) - 1
+            if balance < 0:
+                return balance, True
+            start = pos + 1
+            pos = line.find(closer, start)
+        return balance + line.count(opener, start), False
+    
     @staticmethod
     def _remove_comments(code: str) -> str:
         """Remove single-line and multi-line comments from Verilog code"""
-        # Remove single-line comments
-        code = re.sub(r'//.*?$', '', code, flags=re.MULTILINE)
-        # Remove multi-line comments
-        code = re.sub(r'/\*.*?\*/', '', code, flags=re.DOTALL)
-        return code
+        return _strip_comments(code)
     
     @staticmethod
     def get_verilog_version(verilog_code: str) -> str:
         """Detect Verilog version based on syntax features"""
         # SystemVerilog indicators
-        if re.search(r'\b(logic|always_ff|always_comb|always_latch|interface|class|package)\b', verilog_code):
+        if _RE_SV_FEATURES.search(verilog_code):
             return "SystemVerilog"
         
         # Verilog-2001 indicators
-        if re.search(r'\b(localparam|generate|signed|unsigned)\b', verilog_code) or \
-           re.search(r'@\(\*\)', verilog_code):  # @(*) sensitivity list
+        if _RE_V2001_FEATURES.search(verilog_code) or \
+           _RE_STAR_SENSITIVITY.search(verilog_code):  # @(*) sensitivity list
             return "Verilog-2001"
         
         # Default to Verilog-95
@@ -1670,13 +1837,12 @@ class VerilogParser:
         }
         
         # Extract module name
-        module_match = re.search(r'module\s+(\w+)', verilog_code)
+        module_match = _RE_MODULE_NAME.search(verilog_code)
         if module_match:
             module_info['name'] = module_match.group(1)
         
         # Extract parameters
-        param_pattern = r'parameter\s+(?:\[.*?\]\s+)?(\w+)\s*=\s*([^;,]+)'
-        for match in re.finditer(param_pattern, verilog_code):
+        for match in _RE_PARAM.finditer(verilog_code):
             module_info['parameters'].append({
                 'name': match.group(1),
                 'value': match.group(2).strip()
@@ -1684,73 +1850,62 @@ class VerilogParser:
         
         # Extract ports - improved regex to avoid false matches
         # Remove comments first to avoid parsing commented code
-        code_no_comments = re.sub(r'//.*?$', '', verilog_code, flags=re.MULTILINE)
-        code_no_comments = re.sub(r'/\*.*?\*/', '', code_no_comments, flags=re.DOTALL)
+        code_no_comments = _strip_comments(verilog_code)
         
-        port_patterns = [
-            (r'input\s+(?:wire\s+)?(?:\[(\d+):(\d+)\]\s+)?(\w+)\s*[,;)]', 'inputs'),
-            (r'output\s+(?:reg|wire\s+)?(?:\[(\d+):(\d+)\]\s+)?(\w+)\s*[,;)]', 'outputs'),
-            (r'inout\s+(?:\[(\d+):(\d+)\]\s+)?(\w+)\s*[,;)]', 'inouts')
-        ]
+        # Names already collected per bucket, for O(1) duplicate checks
+        seen = {'inputs': set(), 'outputs': set(), 'inouts': set(), 'wires': set(), 'regs': set()}
         
-        for pattern, port_type in port_patterns:
-            for match in re.finditer(pattern, code_no_comments):
-                port_name = match.group(3)
-                # Skip if already added (avoid duplicates)
-                if any(p['name'] == port_name for p in module_info[port_type]):
-                    continue
-                    
-                if match.group(1) and match.group(2):
-                    width = int(match.group(1)) - int(match.group(2)) + 1
-                    module_info[port_type].append({
-                        'name': port_name,
-                        'width': width,
-                        'msb': int(match.group(1)),
-                        'lsb': int(match.group(2))
-                    })
-                else:
-                    module_info[port_type].append({
-                        'name': port_name,
-                        'width': 1,
-                        'msb': 0,
-                        'lsb': 0
-                    })
-        
-        # Extract internal signals (wires and regs) - avoid parsing comments
-        wire_pattern = r'wire\s+(?:\[(\d+):(\d+)\]\s+)?(\w+)\s*[,;]'
-        for match in re.finditer(wire_pattern, code_no_comments):
-            signal_name = match.group(3)
-            # Skip if it's already a port or already added
-            if any(signal_name == p['name'] for p in module_info['inputs'] + module_info['outputs'] + module_info['wires']):
+        # One scan for every declaration; internal signals are resolved after all ports
+        internal = []
+        for match in _RE_DECLS.finditer(code_no_comments):
+            if match.group('port') is None:
+                internal.append(match)
                 continue
-                
-            if match.group(1) and match.group(2):
-                width = int(match.group(1)) - int(match.group(2)) + 1
-                module_info['wires'].append({
-                    'name': signal_name,
-                    'width': width
+            
+            port_type = match.group('kind') + 's'
+            port_name = match.group('name')
+            # Skip if already added (avoid duplicates)
+            if port_name in seen[port_type]:
+                continue
+            seen[port_type].add(port_name)
+            
+            msb, lsb = match.group('msb'), match.group('lsb')
+            if msb and lsb:
+                width = int(msb) - int(lsb) + 1
+                module_info[port_type].append({
+                    'name': port_name,
+                    'width': width,
+                    'msb': int(msb),
+                    'lsb': int(lsb)
                 })
             else:
-                module_info['wires'].append({
-                    'name': signal_name,
-                    'width': 1
+                module_info[port_type].append({
+                    'name': port_name,
+                    'width': 1,
+                    'msb': 0,
+                    'lsb': 0
                 })
         
-        reg_pattern = r'reg\s+(?:\[(\d+):(\d+)\]\s+)?(\w+)\s*[,;]'
-        for match in re.finditer(reg_pattern, code_no_comments):
-            signal_name = match.group(3)
+        # Extract internal signals (wires and regs) - avoid parsing comments
+        # A wire may not shadow an input/output, a reg may not shadow an output
+        shadowed = {'wires': ('inputs', 'outputs', 'wires'), 'regs': ('outputs', 'regs')}
+        for match in internal:
+            kind = match.group('kind') + 's'
+            signal_name = match.group('name')
             # Skip if it's already a port or already added
-            if any(signal_name == p['name'] for p in module_info['outputs'] + module_info['regs']):
+            if any(signal_name in seen[bucket] for bucket in shadowed[kind]):
                 continue
-                
-            if match.group(1) and match.group(2):
-                width = int(match.group(1)) - int(match.group(2)) + 1
-                module_info['regs'].append({
+            seen[kind].add(signal_name)
+            
+            msb, lsb = match.group('msb'), match.group('lsb')
+            if msb and lsb:
+                width = int(msb) - int(lsb) + 1
+                module_info[kind].append({
                     'name': signal_name,
                     'width': width
                 })
             else:
-                module_info['regs'].append({
+                module_info[kind].append({
                     'name': signal_name,
                     'width': 1
                 })
@@ -1758,16 +1913,8 @@ class VerilogParser:
         return module_info
 
 
-class TestbenchGenerator:
-    """Generate automatic testbench for Verilog modules"""
-    
-    @staticmethod
-    def generate_testbench(module_info: Dict[str, Any], test_vectors: int = 100) -> str:
-        """Generate comprehensive testbench"""
-        module_name = module_info['name']
-        tb_name = f"{module_name}_tb"
-        
-        tb_code = f"""// Automatic Testbench for {module_name}
+# Testbench text blocks, filled with str.format_map by TestbenchGenerator
+_TB_HEADER = """// Automatic Testbench for {module_name}
 // Generated by AWaveViewer
 //
 // IMPORTANT: When using this testbench:
@@ -1784,130 +1931,158 @@ module {tb_name};
 
     // Parameters
 """
+
+_TB_CLOCK = """    // Clock generation
+    initial begin
+        {clk_name} = 0;
+        forever #5 {clk_name} = ~{clk_name};  // 100MHz clock
+    end
+"""
+
+_TB_RESET = """
+    // Reset generation
+    initial begin
+        {rst_name} = 1;
+        #20 {rst_name} = 0;
+        #10 {rst_name} = 1;
+    end
+"""
+
+_TB_STIMULUS = """
+    // Test stimulus
+    integer i;
+    initial begin
+        // Initialize inputs
+"""
+
+_TB_VECTOR_LOOP = """
+        // Wait for reset
+        #50;
+        
+        // Apply test vectors
+        for (i = 0; i < {test_vectors}; i = i + 1) begin
+"""
+
+_TB_FINISH = """            #10;
+        end
+        
+        // Finish simulation
+        #100;
+        $display("Simulation completed successfully");
+        $finish;
+    end
+    
+    // Monitor signals
+    initial begin
+        $monitor("Time=%0t", $time"""
+
+_TB_FOOTER = """);
+    end
+    
+    // VCD dump for waveform viewing
+    initial begin
+        $dumpfile("wave.vcd");
+        $dumpvars(0, {tb_name});
+    end
+
+endmodule
+"""
+
+
+class TestbenchGenerator:
+    """Generate automatic testbench for Verilog modules"""
+    
+    @staticmethod
+    def generate_testbench(module_info: Dict[str, Any], test_vectors: int = 100) -> str:
+        """Generate comprehensive testbench"""
+        module_name = module_info['name']
+        tb_name = f"{module_name}_tb"
+        ctx = {'module_name': module_name, 'tb_name': tb_name, 'test_vectors': test_vectors}
+        
+        parts = [_TB_HEADER.format_map(ctx)]
         
         # Add parameters
         for param in module_info['parameters']:
-            tb_code += f"    parameter {param['name']} = {param['value']};\n"
+            parts.append(f"    parameter {param['name']} = {param['value']};\n")
         
-        tb_code += "\n    // Inputs\n"
+        parts.append("\n    // Inputs\n")
         for inp in module_info['inputs']:
             if inp['width'] > 1:
-                tb_code += f"    reg [{inp['msb']}:{inp['lsb']}] {inp['name']};\n"
+                parts.append(f"    reg [{inp['msb']}:{inp['lsb']}] {inp['name']};\n")
             else:
-                tb_code += f"    reg {inp['name']};\n"
+                parts.append(f"    reg {inp['name']};\n")
         
-        tb_code += "\n    // Outputs\n"
+        parts.append("\n    // Outputs\n")
         for out in module_info['outputs']:
             if out['width'] > 1:
-                tb_code += f"    wire [{out['msb']}:{out['lsb']}] {out['name']};\n"
+                parts.append(f"    wire [{out['msb']}:{out['lsb']}] {out['name']};\n")
             else:
-                tb_code += f"    wire {out['name']};\n"
+                parts.append(f"    wire {out['name']};\n")
         
-        tb_code += "\n    // Inouts\n"
+        parts.append("\n    // Inouts\n")
         for inout in module_info['inouts']:
             if inout['width'] > 1:
-                tb_code += f"    wire [{inout['msb']}:{inout['lsb']}] {inout['name']};\n"
+                parts.append(f"    wire [{inout['msb']}:{inout['lsb']}] {inout['name']};\n")
             else:
-                tb_code += f"    wire {inout['name']};\n"
+                parts.append(f"    wire {inout['name']};\n")
         
         # Instantiate DUT
-        tb_code += f"\n    // Instantiate the Unit Under Test (UUT)\n"
-        tb_code += f"    {module_name} "
+        parts.append(f"\n    // Instantiate the Unit Under Test (UUT)\n")
+        parts.append(f"    {module_name} ")
         
         if module_info['parameters']:
-            tb_code += "#(\n"
+            parts.append("#(\n")
             param_list = [f"        .{p['name']}({p['name']})" for p in module_info['parameters']]
-            tb_code += ",\n".join(param_list)
-            tb_code += "\n    ) "
+            parts.append(",\n".join(param_list))
+            parts.append("\n    ) ")
         
-        tb_code += "uut (\n"
+        parts.append("uut (\n")
         
         all_ports = module_info['inputs'] + module_info['outputs'] + module_info['inouts']
         port_list = [f"        .{p['name']}({p['name']})" for p in all_ports]
-        tb_code += ",\n".join(port_list)
-        tb_code += "\n    );\n\n"
+        parts.append(",\n".join(port_list))
+        parts.append("\n    );\n\n")
         
         # Clock generation (if clock signal exists)
         clock_signals = [inp for inp in module_info['inputs'] if 'clk' in inp['name'].lower() or 'clock' in inp['name'].lower()]
         if clock_signals:
-            clk_name = clock_signals[0]['name']
-            tb_code += f"""    // Clock generation
-    initial begin
-        {clk_name} = 0;
-        forever #5 {clk_name} = ~{clk_name};  // 100MHz clock
-    end
-"""
+            ctx['clk_name'] = clock_signals[0]['name']
+            parts.append(_TB_CLOCK.format_map(ctx))
         
         # Reset generation
         reset_signals = [inp for inp in module_info['inputs'] if 'rst' in inp['name'].lower() or 'reset' in inp['name'].lower()]
         if reset_signals:
-            rst_name = reset_signals[0]['name']
-            tb_code += f"""
-    // Reset generation
-    initial begin
-        {rst_name} = 1;
-        #20 {rst_name} = 0;
-        #10 {rst_name} = 1;
-    end
-"""
+            ctx['rst_name'] = reset_signals[0]['name']
+            parts.append(_TB_RESET.format_map(ctx))
+        
+        # Clock and reset are driven above, not by the stimulus
+        skip_names = {s['name'] for s in clock_signals} | {s['name'] for s in reset_signals}
         
         # Test stimulus
-        tb_code += f"""
-    // Test stimulus
-    integer i;
-    initial begin
-        // Initialize inputs
-"""
+        parts.append(_TB_STIMULUS)
         for inp in module_info['inputs']:
-            if inp['name'] not in [s['name'] for s in clock_signals + reset_signals]:
-                tb_code += f"        {inp['name']} = 0;\n"
-        
-        tb_code += f"""
-        // Wait for reset
-        #50;
+            if inp['name'] not in skip_names:
+                parts.append(f"        {inp['name']} = 0;\n")
         
-        // Apply test vectors
-        for (i = 0; i < {test_vectors}; i = i + 1) begin
-"""
+        parts.append(_TB_VECTOR_LOOP.format_map(ctx))
         
         for inp in module_info['inputs']:
-            if inp['name'] not in [s['name'] for s in clock_signals + reset_signals]:
+            if inp['name'] not in skip_names:
                 if inp['width'] > 1:
-                    tb_code += f"            {inp['name']} = $random % (1 << {inp['width']});\n"
+                    parts.append(f"            {inp['name']} = $random % (1 << {inp['width']});\n")
                 else:
-                    tb_code += f"            {inp['name']} = $random % 2;\n"
+                    parts.append(f"            {inp['name']} = $random % 2;\n")
         
-        tb_code += """            #10;
-        end
-        
-        // Finish simulation
-        #100;
-        $display("Simulation completed successfully");
-        $finish;
-    end
-    
-    // Monitor signals
-    initial begin
-        $monitor("Time=%0t", $time"""
+        parts.append(_TB_FINISH)
         
         for inp in module_info['inputs']:
-            tb_code += f', " {inp["name"]}=%b", {inp["name"]}'
+            parts.append(f', " {inp["name"]}=%b", {inp["name"]}')
         for out in module_info['outputs']:
-            tb_code += f', " {out["name"]}=%b", {out["name"]}'
+            parts.append(f', " {out["name"]}=%b", {out["name"]}')
         
-        tb_code += """);
-    end
-    
-    // VCD dump for waveform viewing
-    initial begin
-        $dumpfile("wave.vcd");
-        $dumpvars(0, """ + tb_name + """);
-    end
-
-endmodule
-"""
+        parts.append(_TB_FOOTER.format_map(ctx))
         
-        return tb_code
+        return "".join(parts)
 
 
 class VCDParser:
@@ -1916,101 +2091,143 @@ class VCDParser:
     def __init__(self):
         self.timescale = 1
         self.signals = {}
-        self.changes = []
+        self.changes = _Timeline(2)  # (time, identifier, value)
         self.scope_hierarchy = []
         
     def parse(self, vcd_file: str) -> Tuple[Dict, List]:
         """Parse VCD file and return signals and value changes"""
-        if not os.path.exists(vcd_file):
-            return {}, []
-        
-        with open(vcd_file, 'r') as f:
-            lines = f.readlines()
-        
-        in_header = True
-        current_time = 0
-        
-        for line in lines:
-            line = line.strip()
-            
-            if not line:
-                continue
-            
-            if line.startswith('$timescale'):
-                # Parse timescale
-                match = re.search(r'(\d+)\s*(\w+)', line)
-                if match:
-                    scale_value = int(match.group(1))
-                    scale_unit = match.group(2)
-                    unit_map = {'s': 1e0, 'ms': 1e-3, 'us': 1e-6, 'ns': 1e-9, 'ps': 1e-12, 'fs': 1e-15}
-                    self.timescale = scale_value * unit_map.get(scale_unit, 1e-9)
-            
-            elif line.startswith('$scope'):
-                parts = line.split()
-                if len(parts) >= 3:
-                    self.scope_hierarchy.append(parts[2])
-            
-            elif line.startswith('$upscope'):
-                if self.scope_hierarchy:
-                    self.scope_hierarchy.pop()
-            
-            elif line.startswith('$var'):
-                # Parse variable declaration
-                parts = line.split()
-                if len(parts) >= 5:
-                    var_type = parts[1]
-                    width = int(parts[2])
-                    identifier = parts[3]
-                    signal_name = parts[4]
-                    
-                    full_name = '.'.join(self.scope_hierarchy + [signal_name])
-                    
-                    self.signals[identifier] = {
-                        'name': signal_name,
-                        'full_name': full_name,
-                        'width': width,
-                        'type': var_type,
-                        'values': []
-                    }
-                    # Debug: Print parsed signal
-                    print(f"DEBUG: Registered signal '{signal_name}' with identifier '{identifier}'")
-            
-            elif line.startswith('$enddefinitions'):
-                in_header = False
-            
-            elif not in_header:
-                if line.startswith('#'):
-                    # Time marker
-                    current_time = int(line[1:])
+        if not os.path.exists(vcd_file):
+            return {}, []
+        
+        in_header = True
+        current_time = 0
+        # Bus value strings are deduplicated through this table so repeated values share
+        # one object (single-bit values are one-character strings, already shared)
+        bus_values = {}
+        
+        # Stream the dump line by line instead of loading it all into memory
+        with open(vcd_file, 'r', buffering=1 << 20) as f:
+            for line in f:
+                line = line.strip()
                 
-                elif line[0] in '01xzXZ':
-                    # Single bit value change
-                    value = line[0]
-                    identifier = line[1:].strip()  # Strip whitespace from identifier
-                    
-                    # Debug: Print each value change
-                    print(f"DEBUG: Time {current_time}: value '{value}' for identifier '{identifier}'")
-                    
-                    if identifier in self.signals:
-                        self.signals[identifier]['values'].append((current_time, value))
-                        self.changes.append((current_time, identifier, value))
-                        print(f"  -> Stored for signal '{self.signals[identifier]['name']}'")
-                    else:
-                        # Debug: Print unmatched identifiers
-                        print(f"  -> ERROR: Identifier '{identifier}' not found! Available: {list(self.signals.keys())}")
+                if not line:
+                    continue
+                
+                c0 = line[0]
+                if c0 == '$':
+                    self._parse_command(line)
+                    if line.startswith('$enddefinitions'):
+                        in_header = False
                 
-                elif line[0] == 'b':
-                    # Multi-bit value change
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        value = parts[0][1:]  # Remove 'b' prefix
-                        identifier = parts[1]
+                elif not in_header:
+                    if c0 == '#':
+                        # Time marker
+                        current_time = int(line[1:])
+                    
+                    elif c0 in _SINGLE_BIT_SET:
+                        # Single bit value change
+                        value = c0
+                        identifier = line[1:].strip()  # Strip whitespace from identifier
+                        
+                        # Debug: Print each value change
+                        if _DEBUG:
+                            print(f"DEBUG: Time {current_time}: value '{value}' for identifier '{identifier}'")
                         
                         if identifier in self.signals:
                             self.signals[identifier]['values'].append((current_time, value))
                             self.changes.append((current_time, identifier, value))
+                            if _DEBUG:
+                                print(f"  -> Stored for signal '{self.signals[identifier]['name']}'")
+                        elif _DEBUG:
+                            # Debug: Print unmatched identifiers
+                            print(f"  -> ERROR: Identifier '{identifier}' not found ({len(self.signals)} signals registered)")
+                    
+                    elif c0 == 'b':
+                        # Multi-bit value change
+                        parts = line.split()
+                        if len(parts) >= 2:
+                            value = parts[0][1:]  # Remove 'b' prefix
+                            value = bus_values.setdefault(value, value)
+                            identifier = parts[1]
+                            
+                            if identifier in self.signals:
+                                self.signals[identifier]['values'].append((current_time, value))
+                                self.changes.append((current_time, identifier, value))
         
         return self.signals, self.changes
+    
+    def _parse_command(self, line: str):
+        """Handle a header '$' command line (timescale, scope and var declarations)"""
+        if line.startswith('$timescale'):
+            # Parse timescale
+            match = _RE_TIMESCALE.search(line)
+            if match:
+                scale_value = int(match.group(1))
+                scale_unit = match.group(2)
+                self.timescale = scale_value * _UNIT_MAP.get(scale_unit, 1e-9)
+        
+        elif line.startswith('$scope'):
+            parts = line.split()
+            if len(parts) >= 3:
+                self.scope_hierarchy.append(parts[2])
+        
+        elif line.startswith('$upscope'):
+            if self.scope_hierarchy:
+                self.scope_hierarchy.pop()
+        
+        elif line.startswith('$var'):
+            # Parse variable declaration
+            parts = line.split()
+            if len(parts) >= 5:
+                var_type = parts[1]
+                width = int(parts[2])
+                identifier = parts[3]
+                signal_name = parts[4]
+                
+                full_name = '.'.join(self.scope_hierarchy + [signal_name])
+                
+                values = _Timeline()  # (time, value), times packed for bisecting
+                self.signals[identifier] = {
+                    'name': signal_name,
+                    'full_name': full_name,
+                    'width': width,
+                    'type': var_type,
+                    'values': values,
+                    'times': values.times
+                }
+                # Debug: Print parsed signal
+                if _DEBUG:
+                    print(f"DEBUG: Registered signal '{signal_name}' with identifier '{identifier}'")
+
+
+_X_CHARS = frozenset('xX')
+_Z_CHARS = frozenset('zZ')
+_BIN_CHARS = frozenset('01')
+
+
+@functools.lru_cache(maxsize=4096)
+def _bus_flags(value: str) -> int:
+    """Return bit 0 set if a bus value holds X bits, bit 1 if Z bits, bit 2 if it is not plain binary"""
+    chars = set(value)
+    return ((1 if chars & _X_CHARS else 0) | (2 if chars & _Z_CHARS else 0)
+            | (0 if chars and chars <= _BIN_CHARS else 4))
+
+
+def _format_bus(value: str, width: int) -> tuple[str, str, QColor]:
+    """Return (segment_text, tail_text, text_color) for a bus value label"""
+    flags = _bus_flags(value)
+    if flags & 1:
+        return (f"X ({value[:8]}...)" if len(value) > 8 else "X"), "X", QColor(255, 100, 100)
+    if flags & 2:
+        return (f"Z ({value[:8]}...)" if len(value) > 8 else "Z"), "Z", QColor(255, 220, 100)
+    if flags & 4:
+        # Not a binary number (e.g. other VCD states): show the raw value
+        return (value[:10] + "..." if len(value) > 10 else value), value[:10], QColor(255, 255, 255)
+    # Convert binary to hex for normal values, also show decimal for small buses
+    dec_val = int(value, 2)
+    hex_val = hex(dec_val)[2:].upper()
+    text = f"0x{hex_val} ({dec_val})" if width <= 8 else f"0x{hex_val}"
+    return text, text, QColor(186, 230, 253)
 
 
 class WaveformWidget(QWidget):
@@ -2030,6 +2247,18 @@ class WaveformWidget(QWidget):
         self.setMinimumHeight(400)
         self.setMouseTracking(True)
         
+        # Single-shot throttle: the first move of a burst arms it and later moves leave it
+        # running, so tooltip and cursor refresh at most once per 16 ms while the mouse moves
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._refresh_cursor)
+        
+        # Offscreen copy of the waveform layer; cursor/marker overlays are drawn over it
+        self._wave_pixmap = None
+        self._wave_cache_key = None
+        self._last_cursor_x = None  # Where paintEvent last drew the cursor line
+        
         # Colors - more organized palette
         self.bg_color = QColor(15, 23, 42)
         self.grid_color = QColor(51, 65, 85)
@@ -2045,10 +2274,87 @@ class WaveformWidget(QWidget):
         self.name_bg = QColor(30, 41, 59)
         self.name_bg_alt = QColor(20, 31, 49)
         
+        # Pens, brushes and fonts reused by every paint
+        self._pen_grid_minor = QPen(self.grid_color, 1, Qt.DotLine)
+        self._pen_grid_major = QPen(self.grid_major_color, 1)
+        self._pen_high = QPen(self.signal_high, 2)
+        self._pen_low = QPen(self.signal_low, 2)
+        self._pen_x = QPen(self.signal_x, 2)
+        self._pen_x_dash = QPen(self.signal_x, 1, Qt.DashLine)
+        self._pen_z_dash = QPen(self.signal_z, 2, Qt.DashLine)
+        self._glow_pen_high = QPen(QColor(34, 197, 94, 80), 6)
+        self._glow_pen_low = QPen(QColor(100, 116, 139, 80), 6)
+        self._pen_cursor = QPen(self.cursor_color, 2)
+        self._pen_cursor_glow = [QPen(QColor(251, 191, 36, i * 30), i * 2) for i in range(3, 0, -1)]
+        self._pen_marker = QPen(self.marker_color, 2, Qt.DashLine)
+        self._font_time = QFont("Segoe UI", 9, QFont.Bold)
+        self._font_name = QFont("Segoe UI", 11, QFont.Bold)
+        self._font_bus_width = QFont("Segoe UI", 9)
+        self._font_cursor = QFont("Segoe UI", 10, QFont.Bold)
+        self._font_legend = QFont("Segoe UI", 8)
+        self._font_label = QFont("Consolas", 9, QFont.Bold)
+        self._font_label_small = QFont("Consolas", 8, QFont.Bold)
+        self._label_bg = QColor(20, 20, 30, 220)
+        # Label text bounds keyed by text; the label fonts never change
+        self._label_metrics = QFontMetrics(self._font_label)
+        self._label_small_metrics = QFontMetrics(self._font_label_small)
+        self._text_bounds_cache = {}
+        self._small_text_bounds_cache = {}
+        self._bus_text_bg = QColor(15, 23, 42, 230)
+        # Single-bit value label glow colour and border pen, keyed by label
+        self._value_label_style = {}
+        for label, color in (("1", self.signal_high), ("0", self.signal_low),
+                             ("X", self.signal_x), ("Z", self.signal_z)):
+            glow = QColor(color)
+            glow.setAlpha(60)
+            self._value_label_style[label] = (glow, QPen(color, 1))
+        # Legend texts never change: shape them once as static text. drawStaticText takes
+        # the top-left corner, so baseline positions are shifted up by the font ascent.
+        self._legend_title = QStaticText("Signal States")
+        self._legend_title_top = 20 - QFontMetrics(self._font_time).ascent()
+        self._legend_desc_top = 13 - QFontMetrics(self._font_legend).ascent()
+        self._legend_label_top = (18 - self._label_metrics.height()) // 2
+        self._legend_items = []
+        for label, description, color in (("1", "Logic HIGH", self.signal_high),
+                                          ("0", "Logic LOW", self.signal_low),
+                                          ("X", "Unknown", self.signal_x),
+                                          ("Z", "High-Z", self.signal_z)):
+            static_label = QStaticText(label)
+            static_label.setTextWidth(30)
+            static_label.setTextOption(QTextOption(Qt.AlignHCenter))
+            fill = QColor(color)
+            fill.setAlpha(80)
+            self._legend_items.append((static_label, QStaticText(description), color,
+                                       QPen(color, 2), fill))
+        # Bus label text per width, then per value: {width: {value: (segment, tail, color)}}
+        self._bus_text_cache = {}
+        
+        # Flat bus fills (X / Z / normal); the old 180 -> 120 alpha gradient was barely visible
+        self._bus_fills = {}
+        for kind, (r, g, b) in (('x', (239, 68, 68)), ('z', (251, 191, 36)), ('bus', (59, 130, 246))):
+            self._bus_fills[kind] = QBrush(QColor(r, g, b, 150))
+        # Outline pen, label-border pen and label glow brush per bus kind
+        self._bus_pens = {}
+        for kind, color in (('x', self.signal_x), ('z', self.signal_z), ('bus', self.signal_bus)):
+            glow = QColor(color)
+            glow.setAlpha(75)  # One 2px halo approximating the old 60 + 30 alpha double ring
+            self._bus_pens[kind] = (QPen(color, 2), QPen(color, 1), QBrush(glow))
+        
     def set_signals(self, signals: Dict, visible_signals: List[str]):
         """Set signals to display"""
         self.signals = signals
         self.visible_signals = visible_signals
+        self._wave_cache_key = None
+        
+        # Label caches only ever grow while a file is shown; start fresh on reload
+        self._bus_text_cache.clear()
+        self._text_bounds_cache.clear()
+        self._small_text_bounds_cache.clear()
+        
+        # Packed transition times for bisecting (the VCD parser already provides them)
+        for signal in signals.values():
+            if 'times' not in signal:
+                signal['times'] = array('q', [t for t, _ in signal['values']])
         
         # Calculate max time
         self.max_time = 0
@@ -2074,9 +2380,82 @@ class WaveformWidget(QWidget):
     
     def paintEvent(self, event):
         """Paint waveforms with legend"""
+        # The waveform layer only changes on zoom/pan/resize/signal-list changes; cursor
+        # and marker moves just blit the cached pixmap and redraw the overlay
+        dpr = self.devicePixelRatioF()
+        key = (self.time_offset, self.time_scale, tuple(self.visible_signals),
+               self.width(), self.height(), dpr, self.grid_enabled, self.max_time)
+        if key != self._wave_cache_key or self._wave_pixmap is None:
+            self._wave_pixmap = QPixmap(self.size() * dpr)
+            self._wave_pixmap.setDevicePixelRatio(dpr)
+            wave_painter = QPainter(self._wave_pixmap)
+            wave_painter.setRenderHint(QPainter.Antialiasing)
+            self.draw_waveforms(wave_painter)
+            wave_painter.end()
+            self._wave_cache_key = key
+        
         painter = QPainter(self)
+        painter.setClipRegion(event.region())  # Cursor moves only invalidate narrow strips
+        painter.drawPixmap(0, 0, self._wave_pixmap)
+        self._last_cursor_x = None
+        if not self.visible_signals:
+            return
+        
         painter.setRenderHint(QPainter.Antialiasing)
+        name_width = 250
+        wave_x_start = name_width + 15
+        wave_width = self.width() - wave_x_start - 20
+        
+        # Draw cursor
+        if self.cursor_time is not None:
+            x = wave_x_start + int((self.cursor_time - self.time_offset) * self.time_scale)
+            if wave_x_start <= x <= wave_x_start + wave_width:
+                # Draw cursor line with glow effect
+                for glow_pen in self._pen_cursor_glow:
+                    painter.setPen(glow_pen)
+                    painter.drawLine(x, 0, x, self.height())
+                
+                painter.setPen(self._pen_cursor)
+                painter.drawLine(x, 0, x, self.height())
+                self._last_cursor_x = x
+                
+                # Draw cursor time label with background
+                label_text = f"[T] {self.cursor_time}ns"
+                painter.setFont(self._font_cursor)
+                label_width = 100
+                label_height = 25
+                label_x = min(x + 5, self.width() - label_width - 5)
+                label_y = 5
+                
+                # Label background
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(QColor(251, 191, 36, 200))
+                painter.drawRoundedRect(label_x, label_y, label_width, label_height, 5, 5)
+                
+                # Label text
+                painter.setPen(QColor(15, 23, 42))
+                painter.drawText(label_x, label_y, label_width, label_height, 
+                               Qt.AlignCenter, label_text)
         
+        # Draw markers
+        for marker_time in self.marker_times:
+            x = wave_x_start + int((marker_time - self.time_offset) * self.time_scale)
+            if wave_x_start <= x <= wave_x_start + wave_width:
+                # Draw marker with glow
+                painter.setPen(self._pen_marker)
+                painter.drawLine(x, 0, x, self.height())
+                
+                # Draw marker label
+                painter.setFont(self._font_time)
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(QColor(236, 72, 153, 200))
+                painter.drawEllipse(x - 8, 3, 16, 16)
+                
+                painter.setPen(Qt.white)
+                painter.drawText(x - 8, 3, 16, 16, Qt.AlignCenter, "M")
+    
+    def draw_waveforms(self, painter: QPainter):
+        """Paint the background, legend, grid and every visible signal row"""
         # Background
         painter.fillRect(self.rect(), self.bg_color)
         
@@ -2098,7 +2477,7 @@ class WaveformWidget(QWidget):
         # Draw time grid
         if self.grid_enabled:
             # Minor grid lines
-            painter.setPen(QPen(self.grid_color, 1, Qt.DotLine))
+            painter.setPen(self._pen_grid_minor)
             time_step = max(1, int(50 / self.time_scale))
             for t in range(0, int(self.max_time), time_step):
                 x = wave_x_start + int((t - self.time_offset) * self.time_scale)
@@ -2106,7 +2485,7 @@ class WaveformWidget(QWidget):
                     painter.drawLine(x, 0, x, self.height())
             
             # Major grid lines
-            painter.setPen(QPen(self.grid_major_color, 1))
+            painter.setPen(self._pen_grid_major)
             major_step = max(1, int(200 / self.time_scale))
             for t in range(0, int(self.max_time), major_step):
                 x = wave_x_start + int((t - self.time_offset) * self.time_scale)
@@ -2114,9 +2493,16 @@ class WaveformWidget(QWidget):
                     painter.drawLine(x, 0, x, self.height())
                     # Draw time labels
                     painter.setPen(self.text_color)
-                    painter.setFont(QFont("Segoe UI", 9, QFont.Bold))
+                    painter.setFont(self._font_time)
                     painter.drawText(x + 3, 15, f"{t}ns")
-                    painter.setPen(QPen(self.grid_major_color, 1))
+                    painter.setPen(self._pen_grid_major)
+        
+        # Row separator: a horizontal gradient, so one pen serves every row
+        gradient = QLinearGradient(0, 0, self.width(), 0)
+        gradient.setColorAt(0, QColor(51, 65, 85, 50))
+        gradient.setColorAt(0.5, QColor(71, 85, 105, 100))
+        gradient.setColorAt(1, QColor(51, 65, 85, 50))
+        separator_pen = QPen(QBrush(gradient), 2)
         
         # Draw signals
         y_pos = 35
@@ -2133,7 +2519,7 @@ class WaveformWidget(QWidget):
             
             # Draw signal name with better styling
             painter.setPen(self.text_color)
-            painter.setFont(QFont("Segoe UI", 11, QFont.Bold))
+            painter.setFont(self._font_name)
             
             # Draw icon based on signal type
             icon = "[BUS]" if signal['width'] > 1 else "[BIT]"
@@ -2147,16 +2533,12 @@ class WaveformWidget(QWidget):
             
             # Draw width info for buses
             if signal['width'] > 1:
-                painter.setFont(QFont("Segoe UI", 9))
+                painter.setFont(self._font_bus_width)
                 painter.setPen(QColor(148, 163, 184))
                 painter.drawText(35, y_pos + 45, f"[{signal['width']-1}:0]")
             
             # Draw separator line with gradient
-            gradient = QLinearGradient(0, y_pos + signal_height, self.width(), y_pos + signal_height)
-            gradient.setColorAt(0, QColor(51, 65, 85, 50))
-            gradient.setColorAt(0.5, QColor(71, 85, 105, 100))
-            gradient.setColorAt(1, QColor(51, 65, 85, 50))
-            painter.setPen(QPen(QBrush(gradient), 2))
+            painter.setPen(separator_pen)
             painter.drawLine(0, y_pos + signal_height, self.width(), y_pos + signal_height)
             
             # Draw waveform
@@ -2164,54 +2546,6 @@ class WaveformWidget(QWidget):
             
             y_pos += signal_height + signal_spacing
             signal_index += 1
-        
-        # Draw cursor
-        if self.cursor_time is not None:
-            x = wave_x_start + int((self.cursor_time - self.time_offset) * self.time_scale)
-            if wave_x_start <= x <= wave_x_start + wave_width:
-                # Draw cursor line with glow effect
-                for i in range(3, 0, -1):
-                    alpha = int(i * 30)
-                    painter.setPen(QPen(QColor(251, 191, 36, alpha), i * 2))
-                    painter.drawLine(x, 0, x, self.height())
-                
-                painter.setPen(QPen(self.cursor_color, 2))
-                painter.drawLine(x, 0, x, self.height())
-                
-                # Draw cursor time label with background
-                label_text = f"[T] {self.cursor_time}ns"
-                painter.setFont(QFont("Segoe UI", 10, QFont.Bold))
-                label_width = 100
-                label_height = 25
-                label_x = min(x + 5, self.width() - label_width - 5)
-                label_y = 5
-                
-                # Label background
-                painter.setPen(Qt.NoPen)
-                painter.setBrush(QColor(251, 191, 36, 200))
-                painter.drawRoundedRect(label_x, label_y, label_width, label_height, 5, 5)
-                
-                # Label text
-                painter.setPen(QColor(15, 23, 42))
-                painter.drawText(label_x, label_y, label_width, label_height, 
-                               Qt.AlignCenter, label_text)
-        
-        # Draw markers
-        for marker_time in self.marker_times:
-            x = wave_x_start + int((marker_time - self.time_offset) * self.time_scale)
-            if wave_x_start <= x <= wave_x_start + wave_width:
-                # Draw marker with glow
-                painter.setPen(QPen(self.marker_color, 2, Qt.DashLine))
-                painter.drawLine(x, 0, x, self.height())
-                
-                # Draw marker label
-                painter.setFont(QFont("Segoe UI", 9, QFont.Bold))
-                painter.setPen(Qt.NoPen)
-                painter.setBrush(QColor(236, 72, 153, 200))
-                painter.drawEllipse(x - 8, 3, 16, 16)
-                
-                painter.setPen(Qt.white)
-                painter.drawText(x - 8, 3, 16, 16, Qt.AlignCenter, "M")
     
     def draw_waveform(self, painter: QPainter, signal: Dict, x_start: int, y_start: int, width: int, height: int):
         """Draw individual waveform"""
@@ -2223,358 +2557,244 @@ class WaveformWidget(QWidget):
         y_high = y_start + 5
         y_low = y_start + height - 5
         
-        painter.setClipRect(x_start, y_start, width, height)
+        # Only walk transitions near the viewport: start from the last one before the left
+        # edge (carry-in) and stop after the first one past the right edge
+        values = signal['values']
+        times = signal['times']
+        i0 = max(0, bisect_left(times, self.time_offset) - 1)
+        i1 = bisect_right(times, self.time_offset + width / self.time_scale) + 1
+        visible = values[i0:i1]
+        draw_tail = i1 >= len(values)  # Segment after the last transition is on screen
+        
+        # Pixel x of every visible transition, computed in one pass over the packed times.
+        # Positions are clamped to the waveform area instead of clipping every primitive;
+        # off-screen transitions collapse onto the edge columns and are merged away below.
+        offset, scale = self.time_offset, self.time_scale
+        x_end = x_start + width
+        xs = [min(max(x_start + int((t - offset) * scale), x_start), x_end) for t in times[i0:i1]]
+        first_x = min(max(x_start + int((values[0][0] - offset) * scale), x_start), x_end)
+        end_x = min(max(x_start + int((self.max_time - offset) * scale), x_start), x_end)
+        
+        # Zoomed far out, many transitions share a pixel column. Min/max-style reduction:
+        # per column keep the first and last transition, and remember columns where the
+        # value changed more than once so that activity (clocks, glitches) is still drawn
+        busy_cols = []
+        if len(xs) > 1 and xs[-1] - xs[0] < 2 * len(xs):
+            col_xs, col_visible = [], []
+            n = len(xs)
+            i = 0
+            prev_value = None
+            while i < n:
+                x = xs[i]
+                j = i + 1
+                while j < n and xs[j] == x:
+                    j += 1
+                first, last = visible[i], visible[j - 1]
+                col_xs.append(x)
+                col_visible.append(first)
+                if j - i > 1:
+                    if last[1] != first[1]:
+                        col_xs.append(x)
+                        col_visible.append(last)
+                    changes = 0
+                    for _, value in visible[i:j]:
+                        if prev_value is not None and value != prev_value:
+                            changes += 1
+                        prev_value = value
+                    if changes > 1 and x != x_end:
+                        busy_cols.append(x)
+                prev_value = last[1]
+                i = j
+            xs, visible = col_xs, col_visible
         
         if signal['width'] == 1:
             # Single-bit signal with clear value labels
-            prev_value = None
-            prev_time = 0
-            prev_x = x_start
+            # Lines are bucketed by pen and flushed with one drawLines call per bucket
+            high_lines, low_lines, x_lines, x_hatch, z_lines = [], [], [], [], []
+            high_glow, low_glow = [], []
+            labels = []
+            hatch_y_top = y_mid - 15
+            hatch_y_bot = y_mid + 15
+            
+            def add_segment(x0, x1, state):
+                """Queue the horizontal state line (and label) between two x positions"""
+                if state == '1':
+                    # HIGH state - green line at top
+                    high_lines.append(QLine(x0, y_high, x1, y_high))
+                    label, y, color = "1", y_high, self.signal_high
+                elif state == '0':
+                    # LOW state - gray line at bottom
+                    low_lines.append(QLine(x0, y_low, x1, y_low))
+                    label, y, color = "0", y_low, self.signal_low
+                elif state in 'xX':
+                    # UNKNOWN state - red hatched pattern in middle
+                    x_lines.append(QLine(x0, y_mid, x1, y_mid))
+                    x_hatch.append(QLine(x0, hatch_y_top, x1, hatch_y_bot))
+                    x_hatch.append(QLine(x0, hatch_y_bot, x1, hatch_y_top))
+                    label, y, color = "X", y_mid, self.signal_x
+                elif state in 'zZ':
+                    # HIGH-Z state - yellow dashed line in middle
+                    z_lines.append(QLine(x0, y_mid, x1, y_mid))
+                    label, y, color = "Z", y_mid, self.signal_z
+                else:
+                    return
+                # Draw the value label if segment is wide enough
+                if x1 - x0 > 35:
+                    labels.append((x0, x1, y, label, color))
             
             # Draw initial state from time 0 if first transition is not at time 0
-            if signal['values'] and signal['values'][0][0] > 0:
-                initial_value = 'x'  # Unknown before first transition
-                first_time = signal['values'][0][0]
-                first_x = x_start + int((first_time - self.time_offset) * self.time_scale)
-                
-                # Draw initial unknown state
-                painter.setPen(QPen(self.signal_x, 2))
-                painter.drawLine(x_start, y_mid, first_x, y_mid)
-                
-                # Draw hatched pattern for X
-                painter.setPen(QPen(self.signal_x, 1, Qt.DashLine))
-                hatch_y_top = y_mid - 15
-                hatch_y_bot = y_mid + 15
-                painter.drawLine(x_start, hatch_y_top, first_x, hatch_y_bot)
-                painter.drawLine(x_start, hatch_y_bot, first_x, hatch_y_top)
-            
-            for time, value in signal['values']:
-                x = x_start + int((time - self.time_offset) * self.time_scale)
-                
-                if prev_value is not None:
-                    segment_width = x - prev_x
-                    
-                    # Draw previous state with standard lines
-                    if prev_value == '1':
-                        # HIGH state - green line at top
-                        painter.setPen(QPen(self.signal_high, 2))
-                        painter.drawLine(prev_x, y_high, x, y_high)
-                        
-                        # Draw "1" label if segment is wide enough
-                        if segment_width > 35:
-                            self.draw_value_label(painter, prev_x, x, y_high, "1", self.signal_high)
-                    
-                    elif prev_value == '0':
-                        # LOW state - gray line at bottom
-                        painter.setPen(QPen(self.signal_low, 2))
-                        painter.drawLine(prev_x, y_low, x, y_low)
-                        
-                        # Draw "0" label if segment is wide enough
-                        if segment_width > 35:
-                            self.draw_value_label(painter, prev_x, x, y_low, "0", self.signal_low)
-                    
-                    elif prev_value in 'xX':
-                        # UNKNOWN state - red hatched pattern in middle
-                        painter.setPen(QPen(self.signal_x, 2))
-                        painter.drawLine(prev_x, y_mid, x, y_mid)
-                        
-                        # Draw hatched pattern for X
-                        painter.setPen(QPen(self.signal_x, 1, Qt.DashLine))
-                        hatch_y_top = y_mid - 15
-                        hatch_y_bot = y_mid + 15
-                        painter.drawLine(prev_x, hatch_y_top, x, hatch_y_bot)
-                        painter.drawLine(prev_x, hatch_y_bot, x, hatch_y_top)
-                        
-                        # Draw "X" label if segment is wide enough
-                        if segment_width > 35:
-                            self.draw_value_label(painter, prev_x, x, y_mid, "X", self.signal_x)
-                    
-                    elif prev_value in 'zZ':
-                        # HIGH-Z state - yellow dashed line in middle
-                        painter.setPen(QPen(self.signal_z, 2, Qt.DashLine))
-                        painter.drawLine(prev_x, y_mid, x, y_mid)
-                        
-                        # Draw "Z" label if segment is wide enough
-                        if segment_width > 35:
-                            self.draw_value_label(painter, prev_x, x, y_mid, "Z", self.signal_z)
-                    
-                    # Draw transition edge with glow effect
-                    if value == '1':
-                        # Transition to HIGH
-                        painter.setPen(QPen(self.signal_high, 2))
-                        painter.drawLine(x, y_low, x, y_high)
-                        # Add glow
-                        painter.setPen(QPen(QColor(34, 197, 94, 80), 6))
-                        painter.drawLine(x, y_low, x, y_high)
-                    elif value == '0':
-                        # Transition to LOW
-                        painter.setPen(QPen(self.signal_low, 2))
-                        painter.drawLine(x, y_high, x, y_low)
-                        # Add glow
-                        painter.setPen(QPen(QColor(100, 116, 139, 80), 6))
-                        painter.drawLine(x, y_high, x, y_low)
-                    elif value in 'xX':
-                        # Transition to X
-                        painter.setPen(QPen(self.signal_x, 2))
-                        painter.drawLine(x, y_high, x, y_mid)
-                        painter.drawLine(x, y_low, x, y_mid)
-                    elif value in 'zZ':
-                        # Transition to Z
-                        painter.setPen(QPen(self.signal_z, 2, Qt.DashLine))
-                        painter.drawLine(x, y_high, x, y_mid)
-                        painter.drawLine(x, y_low, x, y_mid)
-                
+            if values[0][0] > 0 and first_x > x_start:
+                # Initial unknown state (no label), with hatched pattern for X
+                x_lines.append(QLine(x_start, y_mid, first_x, y_mid))
+                x_hatch.append(QLine(x_start, hatch_y_top, first_x, hatch_y_bot))
+                x_hatch.append(QLine(x_start, hatch_y_bot, first_x, hatch_y_top))
+            
+            # Hot loop: the first visible transition only seeds the state, and the bucket
+            # appends are bound to locals so each edge costs one QLine and one call
+            add_high, add_low = high_lines.append, low_lines.append
+            add_high_glow, add_low_glow = high_glow.append, low_glow.append
+            add_x, add_z = x_lines.append, z_lines.append
+            transitions = zip(xs, visible)
+            prev_x, (_, prev_value) = next(transitions)
+            for x, (_, value) in transitions:
+                # A rewrite of the same value just extends the current segment
+                if value == prev_value:
+                    continue
+                # Several changes in one pixel column: no zero-width segment, but every
+                # change still gets its edge so the column shows the states it went through
+                if x != prev_x:
+                    add_segment(prev_x, x, prev_value)
+                    prev_x = x
                 prev_value = value
-                prev_time = time
-                prev_x = x
-            
-            # Draw to end with value label
-            if prev_value is not None:
-                end_x = x_start + int((self.max_time - self.time_offset) * self.time_scale)
-                segment_width = end_x - prev_x
                 
-                if prev_value == '1':
-                    painter.setPen(QPen(self.signal_high, 2))
-                    painter.drawLine(prev_x, y_high, end_x, y_high)
-                    if segment_width > 35:
-                        self.draw_value_label(painter, prev_x, end_x, y_high, "1", self.signal_high)
-                elif prev_value == '0':
-                    painter.setPen(QPen(self.signal_low, 2))
-                    painter.drawLine(prev_x, y_low, end_x, y_low)
-                    if segment_width > 35:
-                        self.draw_value_label(painter, prev_x, end_x, y_low, "0", self.signal_low)
-                elif prev_value in 'xX':
-                    painter.setPen(QPen(self.signal_x, 2))
-                    painter.drawLine(prev_x, y_mid, end_x, y_mid)
-                    # Hatched pattern
-                    painter.setPen(QPen(self.signal_x, 1, Qt.DashLine))
-                    hatch_y_top = y_mid - 15
-                    hatch_y_bot = y_mid + 15
-                    painter.drawLine(prev_x, hatch_y_top, end_x, hatch_y_bot)
-                    painter.drawLine(prev_x, hatch_y_bot, end_x, hatch_y_top)
-                    if segment_width > 35:
-                        self.draw_value_label(painter, prev_x, end_x, y_mid, "X", self.signal_x)
-                elif prev_value in 'zZ':
-                    painter.setPen(QPen(self.signal_z, 2, Qt.DashLine))
-                    painter.drawLine(prev_x, y_mid, end_x, y_mid)
-                    if segment_width > 35:
-                        self.draw_value_label(painter, prev_x, end_x, y_mid, "Z", self.signal_z)
+                # Transitions clamped onto the right border are past the viewport
+                if x == x_end:
+                    continue
+                
+                # Transition edge with glow effect
+                if value == '1':
+                    edge = QLine(x, y_low, x, y_high)
+                    add_high(edge)
+                    add_high_glow(edge)
+                elif value == '0':
+                    edge = QLine(x, y_high, x, y_low)
+                    add_low(edge)
+                    add_low_glow(edge)
+                elif value in 'xX':
+                    add_x(QLine(x, y_high, x, y_mid))
+                    add_x(QLine(x, y_low, x, y_mid))
+                elif value in 'zZ':
+                    add_z(QLine(x, y_high, x, y_mid))
+                    add_z(QLine(x, y_low, x, y_mid))
+            
+            # Draw to end with value label; if later (merged or off-screen) transitions
+            # remain, the current state still runs to the right border
+            if draw_tail:
+                add_segment(prev_x, end_x, prev_value)
+            elif prev_x < x_end:
+                add_segment(prev_x, x_end, prev_value)
+            
+            # Columns that toggled several times get a full-height activity edge
+            for x in busy_cols:
+                add_high(QLine(x, y_low, x, y_high))
+            
+            # Glows first so the crisp lines sit on top, labels last
+            for pen, lines in ((self._glow_pen_high, high_glow),
+                               (self._glow_pen_low, low_glow),
+                               (self._pen_high, high_lines),
+                               (self._pen_low, low_lines),
+                               (self._pen_x, x_lines),
+                               (self._pen_x_dash, x_hatch),
+                               (self._pen_z_dash, z_lines)):
+                if lines:
+                    painter.setPen(pen)
+                    painter.drawLines(lines)
+            # Callers only queue labels for segments wider than 35 px
+            painter.setFont(self._font_label_small)
+            for label_args in labels:
+                self.draw_value_label(painter, *label_args)
         
         else:
             # Multi-bit signal (bus) - enhanced with X/Z support
-            prev_time = 0
-            prev_x = x_start
-            prev_value = None
-            
-            # Draw initial state from time 0 if first transition is not at time 0
-            if signal['values'] and signal['values'][0][0] > 0:
-                initial_value = 'x' * signal['width']  # Unknown before first transition
-                first_time = signal['values'][0][0]
-                first_x = x_start + int((first_time - self.time_offset) * self.time_scale)
-                
-                # Draw initial unknown state trapezoid
-                bus_gradient = QLinearGradient(x_start, y_high, first_x, y_low)
-                bus_gradient.setColorAt(0, QColor(239, 68, 68, 180))  # Red for unknown
-                bus_gradient.setColorAt(1, QColor(239, 68, 68, 120))
-                
-                painter.setPen(QPen(self.signal_x, 2))
-                painter.setBrush(bus_gradient)
+            # Trapezoids are bucketed per kind (X / Z / normal) as convex polygons so the
+            # pen and brush are set once per kind; value labels are drawn on top afterwards
+            polygons = {'x': [], 'z': [], 'bus': []}
+            labels = []
+            bus_width = signal['width']
+            bus_text = self._bus_text_cache.get(bus_width)
+            if bus_text is None:
+                bus_text = self._bus_text_cache[bus_width] = {}
+            
+            def add_trapezoid(bucket, x0, x1):
+                """Queue one bus segment trapezoid (slant capped so it stays convex)"""
+                slant = min(8, (x1 - x0) // 2)
+                # Ends clamped onto the viewport border continue off-screen: draw them flat
+                # so panning does not show a value change at the edge
+                left = 0 if x0 == x_start else slant
+                right = 0 if x1 == x_end else slant
+                bucket.append(QPolygonF((QPointF(x0, y_mid), QPointF(x0 + left, y_high),
+                                         QPointF(x1 - right, y_high), QPointF(x1, y_mid),
+                                         QPointF(x1 - right, y_low), QPointF(x0 + left, y_low))))
+            
+            def add_bus_segment(x0, x1, value, tail):
+                """Queue the trapezoid and (space permitting) label of one bus value"""
+                # Determine color based on value content: X red, Z yellow, normal blue
+                flags = _bus_flags(value)
+                kind = 'x' if flags & 1 else 'z' if flags & 2 else 'bus'
+                add_trapezoid(polygons[kind], x0, x1)
                 
-                path = QPainterPath()
-                path.moveTo(x_start, y_mid)
-                path.lineTo(x_start + 8, y_high)
-                path.lineTo(first_x - 8, y_high)
-                path.lineTo(first_x, y_mid)
-                path.lineTo(first_x - 8, y_low)
-                path.lineTo(x_start + 8, y_low)
-                path.closeSubpath()
-                painter.drawPath(path)
+                # Value text with background, only if there's enough space
+                if x1 - x0 > 40:
+                    entry = bus_text.get(value)
+                    if entry is None:
+                        entry = bus_text[value] = _format_bus(value, bus_width)
+                    segment_text, tail_text, text_color = entry
+                    # The final segment uses the short text and no glow
+                    labels.append((x0, x1, tail_text if tail else segment_text, text_color,
+                                   kind, not tail))
             
-            for time, value in signal['values']:
-                x = x_start + int((time - self.time_offset) * self.time_scale)
-                segment_width = x - prev_x
-                
-                # Skip drawing if this is the first value (already drawn above or will be drawn)
-                if prev_value is None:
-                    prev_value = value
-                    prev_time = time
-                    prev_x = x
+            # Draw initial state from time 0 if first transition is not at time 0
+            if values[0][0] > 0 and first_x > x_start:
+                # Initial unknown state trapezoid (red for unknown)
+                add_trapezoid(polygons['x'], x_start, first_x)
+            
+            # The first visible transition seeds the state; each segment shows the value
+            # held over it
+            transitions = zip(xs, visible)
+            prev_x, (_, prev_value) = next(transitions)
+            for x, (_, value) in transitions:
+                # Merge same-value rewrites and skip zero-width segments
+                if value == prev_value:
                     continue
-                
-                # Determine color based on value content
-                has_x = 'x' in str(value).lower()
-                has_z = 'z' in str(value).lower()
-                
-                if has_x:
-                    # Bus contains X values - red gradient
-                    bus_gradient = QLinearGradient(prev_x, y_high, x, y_low)
-                    bus_gradient.setColorAt(0, QColor(239, 68, 68, 180))  # Red
-                    bus_gradient.setColorAt(1, QColor(239, 68, 68, 120))
-                    pen_color = self.signal_x
-                elif has_z:
-                    # Bus contains Z values - yellow gradient
-                    bus_gradient = QLinearGradient(prev_x, y_high, x, y_low)
-                    bus_gradient.setColorAt(0, QColor(251, 191, 36, 180))  # Yellow
-                    bus_gradient.setColorAt(1, QColor(251, 191, 36, 120))
-                    pen_color = self.signal_z
-                else:
-                    # Normal bus - blue gradient
-                    bus_gradient = QLinearGradient(prev_x, y_high, x, y_low)
-                    bus_gradient.setColorAt(0, QColor(59, 130, 246, 180))
-                    bus_gradient.setColorAt(1, QColor(59, 130, 246, 120))
-                    pen_color = self.signal_bus
-                
-                painter.setPen(QPen(pen_color, 2))
-                painter.setBrush(bus_gradient)
-                
-                # Draw trapezoid
-                path = QPainterPath()
-                path.moveTo(prev_x, y_mid)
-                path.lineTo(prev_x + 8, y_high)
-                path.lineTo(x - 8, y_high)
-                path.lineTo(x, y_mid)
-                path.lineTo(x - 8, y_low)
-                path.lineTo(prev_x + 8, y_low)
-                path.closeSubpath()
-                
-                painter.drawPath(path)
-                
-                # Draw value text with background
-                if segment_width > 40:  # Only show value if there's enough space
-                    text_x = (prev_x + x) // 2
-                    
-                    # Format value for display
-                    try:
-                        if has_x:
-                            display_text = f"X ({value[:8]}...)" if len(value) > 8 else f"X"
-                            text_color = QColor(255, 100, 100)
-                        elif has_z:
-                            display_text = f"Z ({value[:8]}...)" if len(value) > 8 else f"Z"
-                            text_color = QColor(255, 220, 100)
-                        else:
-                            # Convert binary to hex for normal values
-                            hex_val = hex(int(value, 2))[2:].upper()
-                            # Also show decimal for small values
-                            dec_val = int(value, 2)
-                            if signal['width'] <= 8:
-                                display_text = f"0x{hex_val} ({dec_val})"
-                            else:
-                                display_text = f"0x{hex_val}"
-                            text_color = QColor(186, 230, 253)
-                    except:
-                        display_text = value[:10] + "..." if len(value) > 10 else value
-                        text_color = QColor(255, 255, 255)
-                    
-                    # Draw text background with glow
-                    painter.setFont(QFont("Consolas", 9, QFont.Bold))
-                    text_rect = painter.fontMetrics().boundingRect(display_text)
-                    text_bg_width = min(text_rect.width() + 12, segment_width - 20)
-                    text_bg_height = text_rect.height() + 6
-                    
-                    # Glow effect
-                    for i in range(2, 0, -1):
-                        painter.setPen(Qt.NoPen)
-                        painter.setBrush(QColor(pen_color.red(), pen_color.green(), pen_color.blue(), 30 * i))
-                        painter.drawRoundedRect(text_x - text_bg_width//2 - i, y_mid - text_bg_height//2 - i,
-                                              text_bg_width + i*2, text_bg_height + i*2, 4, 4)
-                    
-                    # Solid background
-                    painter.setBrush(QColor(15, 23, 42, 230))
-                    painter.setPen(QPen(pen_color, 1))
-                    painter.drawRoundedRect(text_x - text_bg_width//2, y_mid - text_bg_height//2,
-                                          text_bg_width, text_bg_height, 4, 4)
-                    
-                    # Draw text
-                    painter.setPen(text_color)
-                    painter.drawText(text_x - text_bg_width//2, y_mid - text_bg_height//2,
-                                   text_bg_width, text_bg_height,
-                                   Qt.AlignCenter, display_text)
-                
-                prev_time = time
-                prev_x = x
+                if x != prev_x:
+                    add_bus_segment(prev_x, x, prev_value, False)
+                    prev_x = x
                 prev_value = value
             
-            # Draw last segment to end of timeline
-            if prev_value is not None:
-                end_x = x_start + int((self.max_time - self.time_offset) * self.time_scale)
-                segment_width = end_x - prev_x
-                
-                if segment_width > 0:
-                    # Determine color based on last value content
-                    has_x = 'x' in str(prev_value).lower()
-                    has_z = 'z' in str(prev_value).lower()
-                    
-                    if has_x:
-                        bus_gradient = QLinearGradient(prev_x, y_high, end_x, y_low)
-                        bus_gradient.setColorAt(0, QColor(239, 68, 68, 180))
-                        bus_gradient.setColorAt(1, QColor(239, 68, 68, 120))
-                        pen_color = self.signal_x
-                    elif has_z:
-                        bus_gradient = QLinearGradient(prev_x, y_high, end_x, y_low)
-                        bus_gradient.setColorAt(0, QColor(251, 191, 36, 180))
-                        bus_gradient.setColorAt(1, QColor(251, 191, 36, 120))
-                        pen_color = self.signal_z
-                    else:
-                        bus_gradient = QLinearGradient(prev_x, y_high, end_x, y_low)
-                        bus_gradient.setColorAt(0, QColor(59, 130, 246, 180))
-                        bus_gradient.setColorAt(1, QColor(59, 130, 246, 120))
-                        pen_color = self.signal_bus
-                    
-                    painter.setPen(QPen(pen_color, 2))
-                    painter.setBrush(bus_gradient)
-                    
-                    # Draw final trapezoid
-                    path = QPainterPath()
-                    path.moveTo(prev_x, y_mid)
-                    path.lineTo(prev_x + 8, y_high)
-                    path.lineTo(end_x - 8, y_high)
-                    path.lineTo(end_x, y_mid)
-                    path.lineTo(end_x - 8, y_low)
-                    path.lineTo(prev_x + 8, y_low)
-                    path.closeSubpath()
-                    painter.drawPath(path)
-                    
-                    # Draw value text if space permits
-                    if segment_width > 40:
-                        text_x = (prev_x + end_x) // 2
-                        
-                        try:
-                            if has_x:
-                                display_text = "X"
-                                text_color = QColor(255, 100, 100)
-                            elif has_z:
-                                display_text = "Z"
-                                text_color = QColor(255, 220, 100)
-                            else:
-                                hex_val = hex(int(prev_value, 2))[2:].upper()
-                                dec_val = int(prev_value, 2)
-                                if signal['width'] <= 8:
-                                    display_text = f"0x{hex_val} ({dec_val})"
-                                else:
-                                    display_text = f"0x{hex_val}"
-                                text_color = QColor(186, 230, 253)
-                        except:
-                            display_text = str(prev_value)[:10]
-                            text_color = QColor(255, 255, 255)
-                        
-                        painter.setFont(QFont("Consolas", 9, QFont.Bold))
-                        text_rect = painter.fontMetrics().boundingRect(display_text)
-                        text_bg_width = min(text_rect.width() + 12, segment_width - 20)
-                        text_bg_height = text_rect.height() + 6
-                        
-                        # Background
-                        painter.setBrush(QColor(15, 23, 42, 230))
-                        painter.setPen(QPen(pen_color, 1))
-                        painter.drawRoundedRect(text_x - text_bg_width//2, y_mid - text_bg_height//2,
-                                              text_bg_width, text_bg_height, 4, 4)
-                        
-                        # Text
-                        painter.setPen(text_color)
-                        painter.drawText(text_x - text_bg_width//2, y_mid - text_bg_height//2,
-                                       text_bg_width, text_bg_height,
-                                       Qt.AlignCenter, display_text)
-        
-        painter.setClipping(False)
+            # Draw last segment to end of timeline, or to the right border if later
+            # transitions remain
+            if draw_tail:
+                if end_x - prev_x > 0:
+                    add_bus_segment(prev_x, end_x, prev_value, True)
+            elif prev_x < x_end:
+                add_bus_segment(prev_x, x_end, prev_value, False)
+            
+            # One pen/brush setup per kind
+            for kind, bucket in polygons.items():
+                if bucket:
+                    painter.setPen(self._bus_pens[kind][0])
+                    painter.setBrush(self._bus_fills[kind])
+                    for polygon in bucket:
+                        painter.drawConvexPolygon(polygon)
+            
+            # Columns that changed value several times get a full-height activity edge
+            if busy_cols:
+                painter.setPen(self._bus_pens['bus'][0])
+                painter.drawLines([QLine(x, y_high, x, y_low) for x in busy_cols])
+            
+            painter.setFont(self._font_label)
+            for label_args in labels:
+                self.draw_bus_label(painter, y_mid, *label_args)
     
     def draw_legend(self, painter: QPainter):
         """Draw legend showing signal state colors and meanings"""
@@ -2590,57 +2810,77 @@ class WaveformWidget(QWidget):
         
         # Legend title
         painter.setPen(QColor(226, 232, 240))
-        painter.setFont(QFont("Segoe UI", 9, QFont.Bold))
-        painter.drawText(legend_x + 10, legend_y + 20, "Signal States")
+        painter.setFont(self._font_time)
+        painter.drawStaticText(legend_x + 10, legend_y + self._legend_title_top, self._legend_title)
         
         # Draw legend items
         item_y = legend_y + 35
         item_height = 22
+        box_x = legend_x + 15
+        box_width = 30
+        box_height = 18
         
-        legend_items = [
-            ("1", "Logic HIGH", self.signal_high),
-            ("0", "Logic LOW", self.signal_low),
-            ("X", "Unknown", self.signal_x),
-            ("Z", "High-Z", self.signal_z),
-        ]
-        
-        painter.setFont(QFont("Consolas", 9, QFont.Bold))
-        
-        for label, description, color in legend_items:
+        for static_label, static_description, color, box_pen, box_fill in self._legend_items:
             # Draw colored box with value label
-            box_x = legend_x + 15
-            box_width = 30
-            box_height = 18
-            
-            painter.setPen(QPen(color, 2))
-            painter.setBrush(QColor(color.red(), color.green(), color.blue(), 80))
+            painter.setPen(box_pen)
+            painter.setBrush(box_fill)
             painter.drawRoundedRect(box_x, item_y, box_width, box_height, 3, 3)
             
             # Draw label in box
             painter.setPen(color)
-            painter.drawText(box_x, item_y, box_width, box_height, Qt.AlignCenter, label)
+            painter.setFont(self._font_label)
+            painter.drawStaticText(box_x, item_y + self._legend_label_top, static_label)
             
             # Draw description
             painter.setPen(QColor(200, 200, 200))
-            painter.setFont(QFont("Segoe UI", 8))
-            painter.drawText(box_x + box_width + 10, item_y + 13, description)
-            painter.setFont(QFont("Consolas", 9, QFont.Bold))
+            painter.setFont(self._font_legend)
+            painter.drawStaticText(box_x + box_width + 10, item_y + self._legend_desc_top,
+                                   static_description)
             
             item_y += item_height
     
-    def draw_value_label(self, painter: QPainter, x_start: int, x_end: int, y_pos: int, 
-                         label: str, color: QColor):
-        """Draw value label (1, 0, X, Z) on the waveform - Clean and standard"""
+    def draw_bus_label(self, painter: QPainter, y_mid: int, x_start: int, x_end: int,
+                       display_text: str, text_color: QColor, kind: str, glow: bool):
+        """Draw a bus value label centered on its segment; expects the label font to be set"""
         text_x = (x_start + x_end) // 2
         segment_width = x_end - x_start
+        _, border_pen, glow_brush = self._bus_pens[kind]
         
-        # Only draw if segment is wide enough
-        if segment_width < 30:
-            return
+        text_rect = self._text_bounds_cache.get(display_text)
+        if text_rect is None:
+            text_rect = self._label_metrics.boundingRect(display_text)
+            self._text_bounds_cache[display_text] = text_rect
+        text_bg_width = min(text_rect.width() + 12, segment_width - 20)
+        text_bg_height = text_rect.height() + 6
+        
+        # Glow effect
+        if glow:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(glow_brush)
+            painter.drawRoundedRect(text_x - text_bg_width//2 - 2, y_mid - text_bg_height//2 - 2,
+                                  text_bg_width + 4, text_bg_height + 4, 4, 4)
+        
+        # Solid background
+        painter.setBrush(self._bus_text_bg)
+        painter.setPen(border_pen)
+        painter.drawRoundedRect(text_x - text_bg_width//2, y_mid - text_bg_height//2,
+                              text_bg_width, text_bg_height, 4, 4)
+        
+        # Draw text
+        painter.setPen(text_color)
+        painter.drawText(text_x - text_bg_width//2, y_mid - text_bg_height//2,
+                       text_bg_width, text_bg_height,
+                       Qt.AlignCenter, display_text)
+    
+    def draw_value_label(self, painter: QPainter, x_start: int, x_end: int, y_pos: int, 
+                         label: str, color: QColor):
+        """Draw value label (1, 0, X, Z) on the waveform; expects the small label font to be set"""
+        text_x = (x_start + x_end) // 2
         
-        # Use standard font for clean appearance
-        painter.setFont(QFont("Consolas", 8, QFont.Bold))
-        text_rect = painter.fontMetrics().boundingRect(label)
+        text_rect = self._small_text_bounds_cache.get(label)
+        if text_rect is None:
+            text_rect = self._label_small_metrics.boundingRect(label)
+            self._small_text_bounds_cache[label] = text_rect
         
         # Compact label background
         bg_width = text_rect.width() + 8
@@ -2648,14 +2888,16 @@ class WaveformWidget(QWidget):
         bg_x = text_x - bg_width // 2
         bg_y = y_pos - bg_height // 2
         
+        glow_color, border_pen = self._value_label_style[label]
+        
         # Simple subtle glow
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(color.red(), color.green(), color.blue(), 60))
+        painter.setBrush(glow_color)
         painter.drawRoundedRect(bg_x - 2, bg_y - 2, bg_width + 4, bg_height + 4, 2, 2)
         
         # Clean background
-        painter.setBrush(QColor(20, 20, 30, 220))
-        painter.setPen(QPen(color, 1))
+        painter.setBrush(self._label_bg)
+        painter.setPen(border_pen)
         painter.drawRoundedRect(bg_x, bg_y, bg_width, bg_height, 2, 2)
         
         # Draw clean text
@@ -2671,62 +2913,82 @@ class WaveformWidget(QWidget):
             x_offset = event.pos().x() - wave_x_start
             self.cursor_time = int(x_offset / self.time_scale + self.time_offset)
             
-            # Build tooltip showing all signal values at cursor time
-            if self.visible_signals and self.signals:
-                tooltip_text = f"Time: {self.cursor_time} ns\n"
-                tooltip_text += "─" * 30 + "\n"
-                
-                for sig_id in self.visible_signals:
-                    if sig_id in self.signals:
-                        sig = self.signals[sig_id]
-                        value = self.get_value_at_time(sig, self.cursor_time)
-                        sig_name = sig['name'][:20]  # Truncate long names
-                        
-                        # Format value display
-                        if sig['width'] == 1:
-                            # Single bit - show 0, 1, X, Z
-                            if value == '1':
-                                value_display = f"1 (HIGH)"
-                            elif value == '0':
-                                value_display = f"0 (LOW)"
-                            elif value in 'xX':
-                                value_display = f"X (UNKNOWN)"
-                            elif value in 'zZ':
-                                value_display = f"Z (HIGH-Z)"
-                            else:
-                                value_display = str(value)
+            # Tooltip rebuild and repaint are coalesced to one per frame; restarting a pending
+            # timer would postpone the refresh until the mouse stops
+            if not self._update_timer.isActive():
+                self._update_timer.start()
+    
+    def _refresh_cursor(self):
+        """Rebuild the value tooltip and repaint for the latest cursor position"""
+        if self.cursor_time is None:
+            return
+        
+        # Build tooltip showing all signal values at cursor time
+        if self.visible_signals and self.signals:
+            tooltip_text = f"Time: {self.cursor_time} ns\n"
+            tooltip_text += "─" * 30 + "\n"
+            
+            for sig_id in self.visible_signals:
+                if sig_id in self.signals:
+                    sig = self.signals[sig_id]
+                    value = self.get_value_at_time(sig, self.cursor_time)
+                    sig_name = sig['name'][:20]  # Truncate long names
+                    
+                    # Format value display
+                    if sig['width'] == 1:
+                        # Single bit - show 0, 1, X, Z
+                        if value == '1':
+                            value_display = f"1 (HIGH)"
+                        elif value == '0':
+                            value_display = f"0 (LOW)"
+                        elif value in 'xX':
+                            value_display = f"X (UNKNOWN)"
+                        elif value in 'zZ':
+                            value_display = f"Z (HIGH-Z)"
                         else:
-                            # Multi-bit - show hex and decimal
-                            try:
-                                if 'x' not in str(value).lower() and 'z' not in str(value).lower():
-                                    hex_val = hex(int(value, 2))[2:].upper()
-                                    dec_val = int(value, 2)
-                                    value_display = f"0x{hex_val} ({dec_val})"
-                                else:
-                                    value_display = str(value)
-                            except:
+                            value_display = str(value)
+                    else:
+                        # Multi-bit - show hex and decimal
+                        try:
+                            if 'x' not in str(value).lower() and 'z' not in str(value).lower():
+                                hex_val = hex(int(value, 2))[2:].upper()
+                                dec_val = int(value, 2)
+                                value_display = f"0x{hex_val} ({dec_val})"
+                            else:
                                 value_display = str(value)
-                        
-                        tooltip_text += f"{sig_name}: {value_display}\n"
-                
-                self.setToolTip(tooltip_text)
+                        except:
+                            value_display = str(value)
+                    
+                    tooltip_text += f"{sig_name}: {value_display}\n"
             
-            self.update()
+            self.setToolTip(tooltip_text)
+        
+        # Repaint only the strips under the old and the new cursor
+        x = self._cursor_x(self.cursor_time)
+        dirty = self._cursor_strip(x)
+        if self._last_cursor_x is not None:
+            dirty = dirty.united(self._cursor_strip(self._last_cursor_x))
+        self.update(dirty)
+    
+    def _cursor_x(self, time):
+        """Widget x of a time on the waveform area (same layout as paintEvent)"""
+        return 250 + 15 + int((time - self.time_offset) * self.time_scale)
+    
+    def _cursor_strip(self, x):
+        """Area covered by a cursor or marker line at x, its glow and its labels"""
+        label_x = min(x + 5, self.width() - 105)
+        left = min(x - 8, label_x)
+        right = max(x + 8, label_x + 100)
+        return QRect(left, 0, right - left + 1, self.height())
     
     def get_value_at_time(self, signal, time):
         """Get signal value at specific time"""
         if not signal['values']:
             return 'X'
         
-        # Find value at or before this time
-        value = signal['values'][0][1]
-        for t, v in signal['values']:
-            if t <= time:
-                value = v
-            else:
-                break
-        
-        return str(value)
+        # Last transition at or before this time (the first value before any transition)
+        i = max(0, bisect_right(signal['times'], time) - 1)
+        return str(signal['values'][i][1])
     
     def mousePressEvent(self, event):
         """Handle mouse click for markers"""
@@ -2734,7 +2996,7 @@ class WaveformWidget(QWidget):
             if self.cursor_time not in self.marker_times:
                 self.marker_times.append(self.cursor_time)
                 self.marker_times.sort()
-                self.update()
+                self.update(self._cursor_strip(self._cursor_x(self.cursor_time)))
     
     def wheelEvent(self, event):
         """Handle zoom with mouse wheel"""
@@ -2834,96 +3096,101 @@ class SimulationThread(QThread):
         
         self.progress.emit("Generating sample waveform data...")
         
-        vcd_content = "$date\n"
-        vcd_content += "   October 1, 2025\n"
-        vcd_content += "$end\n"
-        vcd_content += "$version\n"
-        vcd_content += "   AWaveViewer Built-in Generator\n"
-        vcd_content += "$end\n"
-        vcd_content += "$timescale 1ns $end\n"
-        
-        # Add scope
-        module_name = self.module_info.get('name', 'testbench')
-        vcd_content += f"$scope module {module_name}_tb $end\n"
-        vcd_content += f"$scope module uut $end\n"
-        
-        # Add variables
-        var_id = 33  # Start with '!'
-        signal_map = {}
-        
-        # Add inputs
-        for inp in self.module_info.get('inputs', []):
-            sig_id = chr(var_id)
-            var_id += 1
-            # Convert width to int for calculations
-            width_int = int(inp['width']) if inp['width'] else 1
-            signal_map[inp['name']] = {'id': sig_id, 'width': width_int, 'type': 'input'}
-            vcd_content += f"$var wire {width_int} {sig_id} {inp['name']} $end\n"
-        
-        # Add outputs
-        for out in self.module_info.get('outputs', []):
-            sig_id = chr(var_id)
-            var_id += 1
-            # Convert width to int for calculations
-            width_int = int(out['width']) if out['width'] else 1
-            signal_map[out['name']] = {'id': sig_id, 'width': width_int, 'type': 'output'}
-            vcd_content += f"$var wire {width_int} {sig_id} {out['name']} $end\n"
-        
-        vcd_content += "$upscope $end\n"
-        vcd_content += "$upscope $end\n"
-        vcd_content += "$enddefinitions $end\n"
-        
-        # Generate initial values
-        vcd_content += "#0\n"
-        vcd_content += "$dumpvars\n"
-        for sig_name, sig_info in signal_map.items():
-            if sig_info['width'] == 1:
-                vcd_content += f"0{sig_info['id']}\n"
-            else:
-                vcd_content += f"b{'0' * sig_info['width']} {sig_info['id']}\n"
-        vcd_content += "$end\n"
-        
-        # Generate waveform data
-        current_values = {name: 0 for name in signal_map.keys()}
-        
-        # Find clock signal
-        clock_signals = [name for name in signal_map.keys() if 'clk' in name.lower() or 'clock' in name.lower()]
-        reset_signals = [name for name in signal_map.keys() if 'rst' in name.lower() or 'reset' in name.lower()]
-        
-        # Generate time steps
-        for t in range(0, 1000, 5):
-            vcd_content += f"#{t}\n"
-            
-            # Toggle clock
-            if clock_signals:
-                clk_name = clock_signals[0]
-                current_values[clk_name] = 1 - current_values[clk_name]
-                vcd_content += f"{current_values[clk_name]}{signal_map[clk_name]['id']}\n"
-            
-            # Handle reset
-            if reset_signals and t < 50:
-                rst_name = reset_signals[0]
-                current_values[rst_name] = 1 if t < 20 else 0
-                vcd_content += f"{current_values[rst_name]}{signal_map[rst_name]['id']}\n"
-            
-            # Random changes for other signals (every 20ns)
-            if t % 20 == 0 and t > 50:
-                for sig_name, sig_info in signal_map.items():
-                    if sig_name not in clock_signals + reset_signals:
-                        if random.random() > 0.7:  # 30% chance of change
-                            if sig_info['width'] == 1:
-                                current_values[sig_name] = random.randint(0, 1)
-                                vcd_content += f"{current_values[sig_name]}{sig_info['id']}\n"
-                            else:
-                                max_val = (1 << sig_info['width']) - 1
-                                current_values[sig_name] = random.randint(0, max_val)
-                                bin_val = bin(current_values[sig_name])[2:].zfill(sig_info['width'])
-                                vcd_content += f"b{bin_val} {sig_info['id']}\n"
-        
-        # Write VCD file
+        # Stream the dump straight to disk: memory stays flat however many signals there are.
+        # Text mode with newline='\n' keeps LF line endings on every platform.
         vcd_path = os.path.join(self.output_dir, 'wave.vcd')
-        with open(vcd_path, 'w') as f:
-            f.write(vcd_content)
+        with open(vcd_path, 'w', encoding='utf-8', newline='\n', buffering=1 << 20) as f:
+            write = f.write
+            f.writelines([
+                "$date\n",
+                "   October 1, 2025\n",
+                "$end\n",
+                "$version\n",
+                "   AWaveViewer Built-in Generator\n",
+                "$end\n",
+                "$timescale 1ns $end\n",
+            ])
+            
+            # Add scope
+            module_name = self.module_info.get('name', 'testbench')
+            write(f"$scope module {module_name}_tb $end\n")
+            write(f"$scope module uut $end\n")
+            
+            # Add variables, inputs first then outputs, with printable ids that never run out
+            signal_map = {}
+            ports = ([(inp, 'input') for inp in self.module_info.get('inputs', [])]
+                     + [(out, 'output') for out in self.module_info.get('outputs', [])])
+            for index, (port, port_type) in enumerate(ports):
+                sig_id = _vcd_id(index)
+                # Convert width to int for calculations
+                width_int = int(port['width']) if port['width'] else 1
+                # Zero line for $dumpvars, built here while the id and width are at hand
+                init = f"0{sig_id}\n" if width_int == 1 else f"b{'0' * width_int} {sig_id}\n"
+                signal_map[port['name']] = {'id': sig_id, 'width': width_int, 'type': port_type,
+                                            'init': init}
+                write(f"$var wire {width_int} {sig_id} {port['name']} $end\n")
+            
+            write("$upscope $end\n")
+            write("$upscope $end\n")
+            write("$enddefinitions $end\n")
+            
+            # Generate initial values
+            write("#0\n")
+            write("$dumpvars\n")
+            f.writelines(sig_info['init'] for sig_info in signal_map.values())
+            write("$end\n")
+            
+            # Generate waveform data (only clock and reset need their previous value)
+            current_values = {name: 0 for name in signal_map.keys()}
+            
+            # Find clock signal
+            clock_signals = [name for name in signal_map.keys() if 'clk' in name.lower() or 'clock' in name.lower()]
+            reset_signals = [name for name in signal_map.keys() if 'rst' in name.lower() or 'reset' in name.lower()]
+            
+            # Value-independent "0<id>"/"1<id>" lines
+            onebit_fmt = {name: (f"0{info['id']}\n", f"1{info['id']}\n") for name, info in signal_map.items()}
+            
+            # Signals that get random stimulus (everything except clock and reset), as flat
+            # (width, format spec, lines) records: lines is the 0/1 line pair for 1-bit
+            # signals and the " <id>" tail of the bus line otherwise
+            special = set(clock_signals) | set(reset_signals)
+            stimulus = []
+            for name, info in signal_map.items():
+                if name in special:
+                    continue
+                width = info['width']
+                if width == 1:
+                    stimulus.append((1, None, onebit_fmt[name]))
+                else:
+                    stimulus.append((width, f"0{width}b", f" {info['id']}\n"))
+            # A uniform value over [0, 2**width) is exactly getrandbits(width), which skips
+            # randint's range checks and rejection loop
+            rand, getrandbits = random.random, random.getrandbits
+            
+            # Generate time steps
+            for t in range(0, 1000, 5):
+                write(f"#{t}\n")
+                
+                # Toggle clock
+                if clock_signals:
+                    clk_name = clock_signals[0]
+                    current_values[clk_name] = 1 - current_values[clk_name]
+                    write(onebit_fmt[clk_name][current_values[clk_name]])
+                
+                # Handle reset
+                if reset_signals and t < 50:
+                    rst_name = reset_signals[0]
+                    current_values[rst_name] = 1 if t < 20 else 0
+                    write(onebit_fmt[rst_name][current_values[rst_name]])
+                
+                # Random changes for other signals (every 20ns)
+                if t % 20 == 0 and t > 50:
+                    for width, spec, lines in stimulus:
+                        if rand() > 0.7:  # 30% chance of change
+                            if width == 1:
+                                write(lines[getrandbits(1)])
+                            else:
+                                write(f"b{format(getrandbits(width), spec)}{lines}")
         
         output_msg = f"Built-in VCD generator completed\n"
         output_msg += f"Generated waveform for module: {module_name}\n"
@@ -2954,12 +3221,13 @@ class AWaveViewer(QMainWindow):
         self.module_info = None
         self.testbench_code = None
         self.vcd_file = None
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir = None  # Created on first simulation run, see temp_dir
         
         # Initialize theme manager
         self.theme_manager = ThemeManager()
         self.current_theme = "Deep Black Green"
         self.current_opacity = 0.95
+        self._last_style_key = None  # (theme, opacity %) of the applied stylesheet
         
         # Syntax highlighter (will be set after editor is created)
         self.syntax_highlighter = None
@@ -2970,6 +3238,13 @@ class AWaveViewer(QMainWindow):
         # Set initial status message
         self.statusBar.showMessage("Ready | AWaveViewer Professional Edition", 3000)
     
+    @property
+    def temp_dir(self) -> str:
+        """Scratch directory for simulation files, created the first time it is needed"""
+        if self._temp_dir is None:
+            self._temp_dir = tempfile.mkdtemp()
+        return self._temp_dir
+    
     def setup_ui(self):
         """Setup organized user interface with tabs"""
         # Central widget
@@ -3006,6 +3281,15 @@ class AWaveViewer(QMainWindow):
         self.setStatusBar(self.statusBar)
         self.statusBar.showMessage("Ready")
     
+    def _make_button(self, text: str, slot, height: int = 40, tooltip: str = None) -> QPushButton:
+        """Create a push button with a minimum height, connected slot and optional tooltip"""
+        button = QPushButton(text)
+        button.setMinimumHeight(height)
+        button.clicked.connect(slot)
+        if tooltip:
+            button.setToolTip(tooltip)
+        return button
+    
     def create_design_tab(self):
         """Create design and testbench tab"""
         design_widget = QWidget()
@@ -3032,21 +3316,16 @@ class AWaveViewer(QMainWindow):
         
         # Add syntax highlighter to Verilog editor
         self.syntax_highlighter = VerilogSyntaxHighlighter(self.verilog_editor.document(), "Dark Blue")
+        self.syntax_highlighter.rehighlight_progress.connect(self.on_rehighlight_progress)
         
         verilog_buttons = QHBoxLayout()
         verilog_buttons.setSpacing(10)
         
-        self.load_btn = QPushButton("[ ] Load Verilog File")
-        self.load_btn.setMinimumHeight(40)
-        self.load_btn.clicked.connect(self.load_verilog_file)
+        self.load_btn = self._make_button("[ ] Load Verilog File", self.load_verilog_file)
         
-        self.parse_btn = QPushButton("[*] Parse Module")
-        self.parse_btn.setMinimumHeight(40)
-        self.parse_btn.clicked.connect(self.parse_verilog)
+        self.parse_btn = self._make_button("[*] Parse Module", self.parse_verilog)
         
-        self.check_syntax_btn = QPushButton("[Check] Syntax Check")
-        self.check_syntax_btn.setMinimumHeight(40)
-        self.check_syntax_btn.clicked.connect(self.check_verilog_syntax)
+        self.check_syntax_btn = self._make_button("[Check] Syntax Check", self.check_verilog_syntax)
         
         verilog_buttons.addWidget(self.load_btn)
         verilog_buttons.addWidget(self.parse_btn)
@@ -3079,9 +3358,7 @@ class AWaveViewer(QMainWindow):
         tb_controls = QHBoxLayout()
         tb_controls.setSpacing(10)
         
-        self.gen_tb_btn = QPushButton("[+] Generate Testbench")
-        self.gen_tb_btn.setMinimumHeight(40)
-        self.gen_tb_btn.clicked.connect(self.generate_testbench)
+        self.gen_tb_btn = self._make_button("[+] Generate Testbench", self.generate_testbench)
         self.gen_tb_btn.setEnabled(False)
         
         tb_controls.addWidget(self.gen_tb_btn)
@@ -3142,9 +3419,7 @@ class AWaveViewer(QMainWindow):
         sim_control_layout.setSpacing(10)
         
         # Run button
-        self.run_sim_btn = QPushButton("▶️ Run Simulation")
-        self.run_sim_btn.setMinimumHeight(50)
-        self.run_sim_btn.clicked.connect(self.run_simulation)
+        self.run_sim_btn = self._make_button("▶️ Run Simulation", self.run_simulation, 50)
         self.run_sim_btn.setEnabled(False)
         self.run_sim_btn.setStyleSheet("""
             QPushButton {
@@ -3193,21 +3468,13 @@ class AWaveViewer(QMainWindow):
         controls_row1 = QHBoxLayout()
         controls_row1.setSpacing(10)
         
-        self.load_vcd_btn = QPushButton("📂 Load VCD")
-        self.load_vcd_btn.setMinimumHeight(40)
-        self.load_vcd_btn.clicked.connect(self.load_vcd_file)
+        self.load_vcd_btn = self._make_button("📂 Load VCD", self.load_vcd_file)
         
-        self.zoom_in_btn = QPushButton("[+] Zoom In")
-        self.zoom_in_btn.setMinimumHeight(40)
-        self.zoom_in_btn.clicked.connect(self.zoom_in)
+        self.zoom_in_btn = self._make_button("[+] Zoom In", self.zoom_in)
         
-        self.zoom_out_btn = QPushButton("[-] Zoom Out")
-        self.zoom_out_btn.setMinimumHeight(40)
-        self.zoom_out_btn.clicked.connect(self.zoom_out)
+        self.zoom_out_btn = self._make_button("[-] Zoom Out", self.zoom_out)
         
-        self.fit_btn = QPushButton("📏 Fit All")
-        self.fit_btn.setMinimumHeight(40)
-        self.fit_btn.clicked.connect(self.fit_all)
+        self.fit_btn = self._make_button("📏 Fit All", self.fit_all)
         
         self.grid_check = QCheckBox("🔲 Grid")
         self.grid_check.setChecked(True)
@@ -3224,40 +3491,26 @@ class AWaveViewer(QMainWindow):
         controls_row2 = QHBoxLayout()
         controls_row2.setSpacing(10)
         
-        self.add_marker_btn = QPushButton("📍 Add Marker")
-        self.add_marker_btn.setMinimumHeight(35)
-        self.add_marker_btn.clicked.connect(self.add_marker)
-        self.add_marker_btn.setToolTip("Add marker at cursor position")
+        self.add_marker_btn = self._make_button("📍 Add Marker", self.add_marker, 35,
+                                                "Add marker at cursor position")
         
-        self.clear_markers_btn = QPushButton("🗑️ Clear Markers")
-        self.clear_markers_btn.setMinimumHeight(35)
-        self.clear_markers_btn.clicked.connect(self.clear_markers)
+        self.clear_markers_btn = self._make_button("🗑️ Clear Markers", self.clear_markers, 35)
         
-        self.measure_btn = QPushButton("📏 Measure")
-        self.measure_btn.setMinimumHeight(35)
+        self.measure_btn = self._make_button("📏 Measure", self.toggle_measure_mode, 35,
+                                             "Measure time between two points")
         self.measure_btn.setCheckable(True)
-        self.measure_btn.clicked.connect(self.toggle_measure_mode)
-        self.measure_btn.setToolTip("Measure time between two points")
         
-        self.compare_btn = QPushButton("⚖️ Compare Signals")
-        self.compare_btn.setMinimumHeight(35)
-        self.compare_btn.clicked.connect(self.compare_signals)
-        self.compare_btn.setToolTip("Compare selected signals for verification")
+        self.compare_btn = self._make_button("⚖️ Compare Signals", self.compare_signals, 35,
+                                             "Compare selected signals for verification")
         
-        self.verify_btn = QPushButton("✓ Auto Verify")
-        self.verify_btn.setMinimumHeight(35)
-        self.verify_btn.clicked.connect(self.auto_verify_logic)
-        self.verify_btn.setToolTip("Automatically verify logic patterns")
+        self.verify_btn = self._make_button("✓ Auto Verify", self.auto_verify_logic, 35,
+                                            "Automatically verify logic patterns")
         
-        self.export_btn = QPushButton("💾 Export")
-        self.export_btn.setMinimumHeight(35)
-        self.export_btn.clicked.connect(self.export_waveform)
-        self.export_btn.setToolTip("Export waveform as image or data")
+        self.export_btn = self._make_button("💾 Export", self.export_waveform, 35,
+                                            "Export waveform as image or data")
         
-        self.inspect_btn = QPushButton("🔍 Inspect Values")
-        self.inspect_btn.setMinimumHeight(35)
-        self.inspect_btn.clicked.connect(self.inspect_values_at_cursor)
-        self.inspect_btn.setToolTip("Show detailed signal values at cursor position")
+        self.inspect_btn = self._make_button("🔍 Inspect Values", self.inspect_values_at_cursor, 35,
+                                             "Show detailed signal values at cursor position")
         
         controls_row2.addWidget(self.add_marker_btn)
         controls_row2.addWidget(self.clear_markers_btn)
@@ -3446,9 +3699,7 @@ class AWaveViewer(QMainWindow):
         logic_layout.setSpacing(5)
         
         # Logic detection button
-        self.analyze_logic_btn = QPushButton("🔍 Analyze Logic Relations")
-        self.analyze_logic_btn.setMinimumHeight(32)
-        self.analyze_logic_btn.clicked.connect(self.analyze_logic_relations)
+        self.analyze_logic_btn = self._make_button("🔍 Analyze Logic Relations", self.analyze_logic_relations, 32)
         self.analyze_logic_btn.setStyleSheet("""
             QPushButton {
                 background-color: rgb(59, 130, 246);
@@ -4561,8 +4812,7 @@ class AWaveViewer(QMainWindow):
             
             # Find module instantiation pattern: module_name #(...) instance_name (...)
             # or: module_name instance_name (...)
-            instantiation_pattern = r'(\w+)\s*(?:#\s*\([^)]*\))?\s+(\w+)\s*\((.*?)\);'
-            matches = re.finditer(instantiation_pattern, testbench_content, re.DOTALL)
+            matches = _RE_INSTANTIATION.finditer(testbench_content)
             
             for match in matches:
                 try:
@@ -4579,8 +4829,7 @@ class AWaveViewer(QMainWindow):
                     
                     # Parse port connections to determine inputs/outputs
                     # Format: .port_name(signal_name)
-                    port_pattern = r'\.\s*(\w+)\s*\(\s*(\w+)\s*\)'
-                    port_matches = re.finditer(port_pattern, port_connections)
+                    port_matches = _RE_PORT_CONNECTION.finditer(port_connections)
                     
                     for port_match in port_matches:
                         try:
@@ -4798,7 +5047,7 @@ class AWaveViewer(QMainWindow):
                 extraction_status = "⚠ Could not auto-extract module info"
             
             # Extract module name from testbench if possible
-            module_match = re.search(r'module\s+(\w+)', testbench_content)
+            module_match = _RE_MODULE_NAME.search(testbench_content)
             if module_match:
                 tb_module_name = module_match.group(1)
                 self.statusBar.showMessage(f"Testbench '{tb_module_name}' loaded - {extraction_status}")
@@ -4872,7 +5121,7 @@ class AWaveViewer(QMainWindow):
         dut_module_name = None
         
         # Look for DUT instantiation to find module name
-        instantiation_match = re.search(r'(\w+)\s+(?:uut|dut|u1|inst|i_\w+)\s*\(', self.testbench_code)
+        instantiation_match = _RE_UUT_INSTANCE.search(self.testbench_code)
         if instantiation_match:
             dut_module_name = instantiation_match.group(1)
             # Check if this module is defined in the testbench file
@@ -4927,16 +5176,16 @@ class AWaveViewer(QMainWindow):
         # Create a minimal module_info if not present or incomplete
         if not self.module_info or not self.module_info.get('name'):
             # Try to extract module name from testbench
-            module_match = re.search(r'(\w+)\s+(?:uut|dut|u1|inst|i_\w+)\s*\(', self.testbench_code)
+            module_match = _RE_UUT_INSTANCE.search(self.testbench_code)
             if module_match:
                 module_name = module_match.group(1)
             elif verilog_content:
                 # Try to get from verilog source
-                module_match = re.search(r'module\s+(\w+)', verilog_content)
+                module_match = _RE_MODULE_NAME.search(verilog_content)
                 module_name = module_match.group(1) if module_match else "design"
             else:
                 # Try to find first module in testbench (that's not the testbench itself)
-                all_modules = re.findall(r'module\s+(\w+)', self.testbench_code)
+                all_modules = _RE_MODULE_NAME.findall(self.testbench_code)
                 # Filter out testbench modules (usually contain 'tb' or 'test')
                 dut_modules = [m for m in all_modules if 'tb' not in m.lower() and 'test' not in m.lower()]
                 module_name = dut_modules[0] if dut_modules else (all_modules[0] if all_modules else "design")
@@ -6095,6 +6344,15 @@ class AWaveViewer(QMainWindow):
         
         self.statusBar.showMessage(f"Theme changed to: {theme_name}", 2000)
     
+    def on_rehighlight_progress(self, done, total):
+        """Show syntax re-highlighting progress for large files"""
+        if total <= 2000:
+            return
+        if done < total:
+            self.statusBar.showMessage(f"Applying syntax theme... {done * 100 // total}%")
+        else:
+            self.statusBar.showMessage("Syntax theme applied", 2000)
+    
     def change_opacity(self, value):
         """Change theme opacity"""
         self.current_opacity = value / 100.0
@@ -6104,6 +6362,12 @@ class AWaveViewer(QMainWindow):
     
     def apply_themed_style(self):
         """Apply current theme and opacity"""
+        # Re-applying an identical stylesheet still makes Qt re-polish every widget
+        style_key = (self.current_theme, round(self.current_opacity * 100))
+        if style_key == self._last_style_key:
+            return
+        self._last_style_key = style_key
+        
         stylesheet = self.theme_manager.get_stylesheet(self.current_theme, self.current_opacity)
         self.setStyleSheet(stylesheet)
     
@@ -6242,7 +6506,8 @@ class AWaveViewer(QMainWindow):
         """Clean up on close"""
         try:
             import shutil
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            if self._temp_dir is not None:
+                shutil.rmtree(self._temp_dir, ignore_errors=True)
         except:
             pass
         event.accept()